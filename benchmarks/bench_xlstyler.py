@@ -0,0 +1,325 @@
+"""Benchmarks of the xlstyle hot paths.
+
+Each case styles a sheet of numbers of the given size and reports the wall
+time, the traced peak memory, the size of the workbook's style tables and
+the size of the saved file. The results are written as JSON so that runs of
+two releases can be compared::
+
+    python benchmarks/bench_xlstyler.py --sizes 10k,100k -o new.json
+    python benchmarks/bench_xlstyler.py --sizes 10k,100k --compare old.json
+
+The "export" case builds, styles and saves a whole sheet with each backend,
+openpyxl and xlsxwriter (``constant_memory``), to compare the two.
+
+With ``--compare`` the exit status is 1 if any case got slower or used more
+memory than the baseline by more than ``--tolerance``.
+"""
+
+import argparse
+import gc
+import io
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from contextlib import redirect_stdout
+
+import openpyxl
+
+from nbkits import xlstyle
+
+N_COLS = 20
+
+SIZES = {"10k": 10_000, "100k": 100_000, "1m": 1_000_000}
+
+
+def _sheet(n_cells):
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    for i in range(n_cells // N_COLS):
+        ws.append([i * N_COLS + j for j in range(N_COLS)])
+    return wb, ws
+
+
+def case_format(ws):
+    (
+        xlstyle(ws)
+        .format(row=1, bold=True, background_color="tab:blue", color="w")
+        .format(skip_header=1, number_format="#,##0.00", ha="right")
+    )
+
+
+def case_border(ws):
+    xlstyle(ws).border(sides="inside", c="tab:gray").border(sides="outside", ls="thick")
+
+
+def case_patten_fill(ws):
+    xlstyle(ws).patten_fill(
+        row=range(2, ws.max_row + 1, 2), type="solid", color="xkcd:light grey"
+    )
+
+
+def case_column_width(ws):
+    xlstyle(ws).column_width([12 + j % 5 for j in range(N_COLS)])
+
+
+def case_row_height(ws):
+    xlstyle(ws).row_height(18, skip_header=1).row_height(30, row=1)
+
+
+def _style_chain(styler):
+    (
+        styler.format(row=1, bold=True, color="w")
+        .format(skip_header=1, number_format="#,##0.00", ha="right")
+        .patten_fill(row=1, type="solid", color="tab:blue")
+        .border(sides="inside", c="tab:gray")
+        .border(sides="outside", ls="thick")
+    )
+
+
+def case_chain(ws):
+    _style_chain(xlstyle(ws))
+
+
+def case_batch(ws):
+    with xlstyle(ws).batch() as styler:
+        _style_chain(styler)
+
+
+CASES = {
+    "format": case_format,
+    "border": case_border,
+    "patten_fill": case_patten_fill,
+    "column_width": case_column_width,
+    "row_height": case_row_height,
+    "chain": case_chain,
+    "batch": case_batch,
+}
+
+
+def _style_tables(wb):
+    return {
+        "fonts": len(wb._fonts),
+        "fills": len(wb._fills),
+        "borders": len(wb._borders),
+        "alignments": len(wb._alignments),
+        "number_formats": len(wb._number_formats),
+        "cell_styles": len(wb._cell_styles),
+    }
+
+
+def _timed(func, *args):
+    gc.collect()
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def _traced_peak(func, *args):
+    gc.collect()
+    tracemalloc.start()
+    try:
+        func(*args)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def _mb(n_bytes):
+    return None if n_bytes is None else round(n_bytes / 2**20, 2)
+
+
+def bench_styler(case, n_cells, memory=True):
+    func = CASES[case]
+    wb, ws = _sheet(n_cells)
+    elapsed = _timed(func, ws)
+
+    buf = io.BytesIO()
+    save_time = _timed(wb.save, buf)
+    stats = {
+        "case": case,
+        "cells": n_cells,
+        "time_s": round(elapsed, 4),
+        "peak_mb": None,
+        "save_s": round(save_time, 4),
+        "file_bytes": buf.tell(),
+        "style_tables": _style_tables(wb),
+    }
+    del wb, ws, buf
+
+    if memory:
+        stats["peak_mb"] = _mb(_traced_peak(func, _sheet(n_cells)[1]))
+
+    return stats
+
+
+def _export_chain(s):
+    return (
+        s.column_width([12 + j % 5 for j in range(N_COLS)])
+        .format(row=1, bold=True, background_color="tab:blue", color="w")
+        .format(skip_header=1, number_format="#,##0.00", ha="right")
+        .border(sides="outside", ls="medium")
+        .border(skip_header=1, sides="h", c="tab:gray")
+    )
+
+
+def export_openpyxl(n_cells):
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    for i in range(n_cells // N_COLS):
+        ws.append([i * N_COLS + j for j in range(N_COLS)])
+    _export_chain(xlstyle(ws))
+    buf = io.BytesIO()
+    wb.save(buf)
+    return buf.tell()
+
+
+def export_xlsxwriter(n_cells):
+    import xlsxwriter
+
+    buf = io.BytesIO()
+    wb = xlsxwriter.Workbook(buf, {"constant_memory": True})
+    rows = [[i * N_COLS + j for j in range(N_COLS)] for i in range(n_cells // N_COLS)]
+    _export_chain(xlstyle(wb.add_worksheet())).write_rows(rows)
+    wb.close()
+    return buf.tell()
+
+
+def bench_export(n_cells, memory=True):
+    """Build, style and save a sheet end to end with each backend."""
+    results = []
+    backends = {"openpyxl": export_openpyxl, "xlsxwriter": export_xlsxwriter}
+    for backend, func in backends.items():
+        gc.collect()
+        start = time.perf_counter()
+        try:
+            file_bytes = func(n_cells)
+        except ImportError:
+            continue
+        elapsed = time.perf_counter() - start
+
+        results.append(
+            {
+                "case": f"export_{backend}",
+                "cells": n_cells,
+                "time_s": round(elapsed, 4),
+                "peak_mb": _mb(_traced_peak(func, n_cells)) if memory else None,
+                "file_bytes": file_bytes,
+            }
+        )
+    return results
+
+
+def bench_hdisplay(n_cells, memory=True):
+    try:
+        import pandas as pd
+        from nbkits import hdisplay
+    except ImportError:
+        return None
+
+    n_rows = n_cells // N_COLS
+    df = pd.DataFrame({f"c{j}": range(j, j + n_rows) for j in range(N_COLS)})
+
+    def show():
+        with redirect_stdout(io.StringIO()):
+            hdisplay(df, df.describe(), titles=["data", "summary"])
+
+    return {
+        "case": "hdisplay",
+        "cells": n_cells,
+        "time_s": round(_timed(show), 4),
+        "peak_mb": _mb(_traced_peak(show)) if memory else None,
+    }
+
+
+def run(sizes, cases, memory=True):
+    results = []
+    for label in sizes:
+        n_cells = SIZES[label]
+        for case in cases:
+            if case == "hdisplay":
+                found = [bench_hdisplay(n_cells, memory=memory)]
+            elif case == "export":
+                found = bench_export(n_cells, memory=memory)
+            else:
+                found = [bench_styler(case, n_cells, memory=memory)]
+
+            for result in found:
+                if result is None:
+                    continue
+                print(
+                    f"{result['case']:>18} {label:>5}: {result['time_s']:9.3f}s"
+                    f" peak={result['peak_mb']}MB",
+                    file=sys.stderr,
+                )
+                results.append(result)
+
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "openpyxl": openpyxl.__version__,
+        },
+        "results": results,
+    }
+
+
+def compare(report, baseline, tolerance):
+    """Return the cases that regressed against ``baseline``."""
+    base = {(r["case"], r["cells"]): r for r in baseline["results"]}
+    regressions = []
+    for result in report["results"]:
+        old = base.get((result["case"], result["cells"]))
+        if old is None:
+            continue
+
+        for key in ["time_s", "peak_mb"]:
+            new_value, old_value = result.get(key), old.get(key)
+            if not new_value or not old_value:
+                continue
+
+            if new_value > old_value * (1 + tolerance):
+                regressions.append(
+                    f"{result['case']} {result['cells']} cells: "
+                    f"{key} {old_value} -> {new_value}"
+                )
+
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="10k,100k,1m")
+    parser.add_argument("--cases", default=",".join([*CASES, "hdisplay", "export"]))
+    parser.add_argument("-o", "--output", help="write the JSON report to a file")
+    parser.add_argument("--compare", help="a JSON report to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    parser.add_argument("--no-memory", action="store_true")
+    args = parser.parse_args(argv)
+
+    report = run(
+        [s.strip().lower() for s in args.sizes.split(",")],
+        [c.strip() for c in args.cases.split(",")],
+        memory=not args.no_memory,
+    )
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text)
+    else:
+        print(text)
+
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(report, json.load(f), args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        return 1 if regressions else 0
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,3 +1,7 @@
 from .xlstyler import xlstyle  # noqa: F401
+from .xlstream import xlstream  # noqa: F401
 from .display import hdisplay  # noqa: F401
-
+from .xlprofile import xlprofile  # noqa: F401
+from .xltemplate import xltemplate  # noqa: F401
+from .xlmany import xlstyle_many  # noqa: F401
+from .xlcompact import compact_styles  # noqa: F401
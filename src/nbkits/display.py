@@ -1,8 +1,7 @@
-from IPython.core.interactiveshell import InteractiveShell
-from IPython.display import display_html
-
-
 def hdisplay(*dfs, titles=None, gap=50, justify="center", alignment="left"):
+    from IPython.core.interactiveshell import InteractiveShell
+    from IPython.display import display_html
+
     if alignment == "left":
         justify = "flex-start"
     elif alignment == "center":
@@ -0,0 +1,57 @@
+"""Process-wide interning of openpyxl style objects.
+
+Identical fonts, fills, alignments, borders and sides are built once and shared
+by every cell, call and sheet that uses them. The shared instances must be
+treated as immutable. Each table is bounded and evicts least recently used
+entries.
+"""
+
+from functools import lru_cache
+
+from openpyxl.styles import Alignment, Border, Font, PatternFill, Side
+
+STYLE_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=STYLE_CACHE_SIZE)
+def intern_font(**kwargs) -> Font:
+    return Font(**kwargs)
+
+
+@lru_cache(maxsize=STYLE_CACHE_SIZE)
+def intern_fill(**kwargs) -> PatternFill:
+    return PatternFill(**kwargs)
+
+
+@lru_cache(maxsize=STYLE_CACHE_SIZE)
+def intern_alignment(**kwargs) -> Alignment:
+    return Alignment(**kwargs)
+
+
+@lru_cache(maxsize=STYLE_CACHE_SIZE)
+def intern_side(**kwargs) -> Side:
+    return Side(**kwargs)
+
+
+@lru_cache(maxsize=STYLE_CACHE_SIZE)
+def intern_border(**kwargs) -> Border:
+    return Border(**kwargs)
+
+
+_CACHES = {
+    "font": intern_font,
+    "fill": intern_fill,
+    "alignment": intern_alignment,
+    "side": intern_side,
+    "border": intern_border,
+}
+
+
+def style_cache_info():
+    """Return the ``lru_cache`` statistics of every style table by name."""
+    return {name: func.cache_info() for name, func in _CACHES.items()}
+
+
+def clear_style_cache():
+    for func in _CACHES.values():
+        func.cache_clear()
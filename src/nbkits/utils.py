@@ -1,32 +1,97 @@
-from matplotlib.colors import BASE_COLORS, CSS4_COLORS, XKCD_COLORS, TABLEAU_COLORS
-from matplotlib.colors import to_hex as _to_hex
+import re
+import sys
+from functools import lru_cache
 
+_HEX_COLOR = re.compile(r"[0-9A-Fa-f]{6}([0-9A-Fa-f]{2})?")
 
+_colors = None
+
+
+def _color_table():
+    global _colors
+    if _colors is None:
+        from . import colors
+
+        _colors = colors
+    return _colors
+
+
+@lru_cache(maxsize=1024)
 def to_hex_color(c: str):
-    v = BASE_COLORS.get(c, None)
+    table = _color_table()
+
+    v = table.BASE_COLORS.get(c, None)
     if v is not None:
-        v = _to_hex(v).upper()
-        return v[1:]
+        return v
 
-    v = CSS4_COLORS.get(c, None)
+    v = table.CSS4_COLORS.get(c, None)
     if v is not None:
-        return v[1:].upper()
+        return v
 
     if c.startswith("tab:"):
-        v = TABLEAU_COLORS.get(c, None)
+        v = table.TABLEAU_COLORS.get(c, None)
         if v is not None:
-            print(v)
-            return v[1:].upper()
+            return v
         else:
-            items = ", ".join(c[4:] for c in TABLEAU_COLORS.keys())
+            items = ", ".join(c[4:] for c in table.TABLEAU_COLORS.keys())
             raise ValueError(f"tableau color must be one of these: {items}")
 
     if c.startswith("xkcd:"):
-        v = XKCD_COLORS.get(c, None)
+        v = table.XKCD_COLORS.get(c, None)
         if v is not None:
-            return v[1:].upper()
+            return v
         else:
-            items = ", ".join(c[5:] for c in XKCD_COLORS.keys())
+            items = ", ".join(c[5:] for c in table.XKCD_COLORS.keys())
             raise ValueError(f"xkcd color must be one of these: {items}")
 
-    return c
+    if _HEX_COLOR.fullmatch(c):
+        return c
+
+    return _mpl_hex_color(c)
+
+
+def _mpl_hex_color(c):
+    """Fall back to matplotlib for other specs such as '#ff8800' or '0.5'."""
+    try:
+        from matplotlib.colors import to_hex
+    except ImportError:
+        return c
+
+    try:
+        return to_hex(c)[1:].upper()
+    except ValueError:
+        return c
+
+
+def to_hex_colors(specs):
+    """Resolve a batch of color specs, each distinct spec only once.
+
+    ``specs`` is a list, a nested list (e.g. one per row) or a NumPy array;
+    the result has the same shape, as nested lists or an object array. None
+    entries are kept as None.
+    """
+    resolved = {None: None}
+
+    def _resolve(items):
+        out = []
+        for c in items:
+            if isinstance(c, (list, tuple)):
+                out.append(_resolve(c))
+                continue
+
+            v = resolved.get(c, resolved)
+            if v is resolved:
+                v = resolved[c] = to_hex_color(c)
+            out.append(v)
+        return out
+
+    if type(specs).__module__ == "numpy":
+        np = sys.modules["numpy"]
+        result = np.empty(specs.shape, dtype=object)
+        if specs.ndim == 0:
+            result[()] = to_hex_color(specs.item())
+        else:
+            result[...] = _resolve(specs.tolist())
+        return result
+
+    return _resolve(specs)
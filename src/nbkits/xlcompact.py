@@ -0,0 +1,80 @@
+from openpyxl.styles.cell_style import StyleArray
+from openpyxl.styles.numbers import BUILTIN_FORMATS_MAX_SIZE
+from openpyxl.utils.indexed_list import IndexedList
+
+# (style array slot, workbook table, leading entries always kept)
+_TABLES = [
+    (0, "_fonts", 1),
+    (1, "_fills", 2),  # Excel requires the "none" and "gray125" fills
+    (2, "_borders", 1),
+    (4, "_protections", 1),
+    (5, "_alignments", 1),
+]
+
+
+def compact_styles(workbook) -> dict[str, int]:
+    """Drop the fonts, fills, borders, ... no cell or dimension uses any more.
+
+    Restyling the same cells leaves the replaced styles in the workbook's
+    tables, and they are all saved. The tables are rebuilt from the styles
+    still referenced by the cells, row and column dimensions and named styles
+    of every sheet, and their style ids are remapped. Returns the number of
+    entries removed from each table.
+    """
+    if workbook.write_only:
+        raise ValueError("the cells of a write-only workbook can't be restyled")
+
+    arrays = {}
+    for style in _style_arrays(workbook):
+        arrays.setdefault(style.tobytes(), style)
+
+    removed = {}
+    remaps = []
+    for slot, name, n_fixed in _TABLES:
+        table = getattr(workbook, name)
+        used = set(range(min(n_fixed, len(table))))
+        used.update(style[slot] for style in arrays.values())
+        kept = sorted(k for k in used if k < len(table))
+        setattr(workbook, name, IndexedList([table[k] for k in kept]))
+        remaps.append((slot, {old: new for new, old in enumerate(kept)}))
+        removed[name[1:]] = len(table) - len(kept)
+
+    formats = workbook._number_formats
+    offset = BUILTIN_FORMATS_MAX_SIZE
+    kept = sorted({s[3] - offset for s in arrays.values() if s[3] >= offset})
+    kept = [k for k in kept if k < len(formats)]
+    workbook._number_formats = IndexedList([formats[k] for k in kept])
+    remaps.append((3, {old + offset: new + offset for new, old in enumerate(kept)}))
+    removed["number_formats"] = len(formats) - len(kept)
+
+    resolved = {}
+    for key, style in arrays.items():
+        new = StyleArray(style)
+        for slot, mapping in remaps:
+            new[slot] = mapping.get(new[slot], new[slot])
+        resolved[key] = new
+
+    done = set()  # an array shared by two owners is remapped once
+    for style in _style_arrays(workbook):
+        if id(style) not in done:
+            done.add(id(style))
+            style[:] = resolved[style.tobytes()]
+
+    removed["cell_styles"] = len(workbook._cell_styles) - 1
+    workbook._cell_styles = IndexedList([StyleArray()])
+    return removed
+
+
+def _style_arrays(workbook):
+    for sheet in workbook.worksheets:
+        for obj in sheet._cells.values():
+            if obj._style is not None:
+                yield obj._style
+
+        for dims in [sheet.row_dimensions, sheet.column_dimensions]:
+            for obj in dims.values():
+                if obj._style is not None:
+                    yield obj._style
+
+    for named in workbook._named_styles:
+        yield named._style
@@ -0,0 +1,160 @@
+import os
+from pathlib import Path
+from typing import NamedTuple
+
+from openpyxl import Workbook, load_workbook
+
+from .xlstyler import xlstyle
+from .xltemplate import StyleTemplate
+
+PLAN_METHODS = [
+    "column_width",
+    "row_height",
+    "border",
+    "format",
+    "patten_fill",
+    "conditional",
+    "copy_style",
+    "define",
+    "apply_style",
+]
+
+
+class StyleResult(NamedTuple):
+    """The outcome of styling one workbook of ``xlstyle_many``."""
+
+    source: str | Workbook
+    output: str | None
+    error: str | None
+
+
+def xlstyle_many(
+    paths_or_workbooks,
+    plan,
+    workers: int | None = None,
+    sheets: str | list[str] | None = None,
+    output_dir: str | None = None,
+) -> list[StyleResult]:
+    """Apply a styling plan to many workbooks, the files in a process pool.
+
+    ``plan`` is a sequence of ``(method, kwargs)`` pairs of the styler, e.g.::
+
+        plan = [
+            ("format", dict(row=1, bold=True, background_color="tab:blue")),
+            ("border", dict(sides="outside")),
+        ]
+        results = xlstyle_many(glob("reports/*.xlsx"), plan, workers=8)
+
+    ``plan`` may also be a ``StyleTemplate``, compiled once and pickled to
+    the workers.
+
+    Each worker loads, styles and saves its files one at a time, overwriting
+    them, or writing them to ``output_dir`` under the same name. The plan is
+    applied to the active sheet, or to the sheets named by ``sheets``.
+    Workbook objects are styled in this process and not saved. The plan must
+    be picklable, so per-cell callables must be module-level functions.
+
+    Two files that would be saved to the same path, e.g. of the same name in
+    different directories, raise a ``ValueError`` before any is styled. An
+    error of one file does not stop the others, the results are in the order
+    of the inputs with the error message of each failed file.
+    """
+    plan = _check_plan(plan)
+    if isinstance(sheets, str):
+        sheets = [sheets]
+
+    if output_dir is not None:
+        os.makedirs(output_dir, exist_ok=True)
+
+    sources = list(paths_or_workbooks)
+    results = [None] * len(sources)
+    paths = []
+    for k, source in enumerate(sources):
+        if isinstance(source, Workbook):
+            results[k] = _style_workbook(source, plan, sheets)
+        else:
+            paths.append((k, os.fspath(source)))
+
+    outputs = {}
+    for _, path in paths:
+        output = os.path.abspath(_output_path(path, output_dir))
+        if output in outputs:
+            msg = f"'{outputs[output]}' and '{path}' would both be saved to '{output}'"
+            raise ValueError(msg)
+        outputs[output] = path
+
+    jobs = [(path, plan, sheets, output_dir) for _, path in paths]
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = min(workers, len(jobs))
+
+    if workers <= 1:
+        done = [_style_file(job) for job in jobs]
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+
+        chunksize = max(1, len(jobs) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            done = list(pool.map(_style_file, jobs, chunksize=chunksize))
+
+    for (k, _), result in zip(paths, done):
+        results[k] = result
+
+    return results
+
+
+def _check_plan(plan):
+    if isinstance(plan, StyleTemplate):
+        return plan
+
+    checked = []
+    for step in plan:
+        try:
+            method, kwargs = step
+        except (TypeError, ValueError):
+            raise ValueError(
+                f"each step of the plan must be a (method, kwargs) pair: {step!r}"
+            ) from None
+
+        if method not in PLAN_METHODS:
+            values = ", ".join(f"'{m}'" for m in PLAN_METHODS)
+            raise ValueError(f"plan method must be one of these values: {values}")
+
+        checked.append((method, dict(kwargs)))
+    return checked
+
+
+def _apply_plan(workbook, plan, sheets):
+    targets = [workbook.active] if sheets is None else [workbook[n] for n in sheets]
+    for sheet in targets:
+        if isinstance(plan, StyleTemplate):
+            plan.apply(sheet)
+            continue
+
+        styler = xlstyle(sheet)
+        for method, kwargs in plan:
+            getattr(styler, method)(**kwargs)
+
+
+def _style_workbook(workbook, plan, sheets):
+    try:
+        _apply_plan(workbook, plan, sheets)
+    except Exception as e:
+        return StyleResult(workbook, None, f"{type(e).__name__}: {e}")
+    return StyleResult(workbook, None, None)
+
+
+def _style_file(job):
+    path, plan, sheets, output_dir = job
+    output = _output_path(path, output_dir)
+    try:
+        workbook = load_workbook(path)
+        _apply_plan(workbook, plan, sheets)
+        workbook.save(output)
+    except Exception as e:
+        return StyleResult(path, None, f"{type(e).__name__}: {e}")
+    return StyleResult(path, output, None)
+
+
+def _output_path(path, output_dir):
+    return path if output_dir is None else str(Path(output_dir) / Path(path).name)
@@ -0,0 +1,131 @@
+import time
+from contextlib import contextmanager
+from functools import wraps
+from typing import NamedTuple
+
+from .stylecache import style_cache_info
+from .utils import to_hex_color
+
+
+class OpStats(NamedTuple):
+    """What one styling operation cost."""
+
+    op: str
+    sheet: str
+    cells_touched: int
+    cells_created: int
+    cells_modified: int
+    styles_allocated: int
+    color_resolutions: int
+    elapsed: float
+
+
+class StyleProfile:
+    """The operation stats of every styler used inside ``xlprofile()``."""
+
+    def __init__(self):
+        self.records: list[OpStats] = []
+
+    def summary(self) -> dict[str, dict]:
+        """Totals per operation name, the most expensive first."""
+        totals = {}
+        for rec in self.records:
+            total = totals.get(rec.op)
+            if total is None:
+                total = totals[rec.op] = dict.fromkeys(OpStats._fields[2:], 0)
+                total["calls"] = 0
+            total["calls"] += 1
+            for field in OpStats._fields[2:]:
+                total[field] += getattr(rec, field)
+
+        return dict(sorted(totals.items(), key=lambda kv: -kv[1]["elapsed"]))
+
+    def report(self) -> str:
+        lines = [
+            f"{'op':<14}{'calls':>7}{'touched':>11}{'created':>11}{'modified':>11}"
+            f"{'styles':>8}{'colors':>8}{'elapsed':>10}"
+        ]
+        for op, t in self.summary().items():
+            lines.append(
+                f"{op:<14}{t['calls']:>7}{t['cells_touched']:>11}"
+                f"{t['cells_created']:>11}{t['cells_modified']:>11}"
+                f"{t['styles_allocated']:>8}{t['color_resolutions']:>8}"
+                f"{t['elapsed']:>10.3f}"
+            )
+        return "\n".join(lines)
+
+
+_profiles: list[StyleProfile] = []
+
+
+@contextmanager
+def xlprofile():
+    """Collect the stats of all styling operations run inside the block::
+
+    with xlprofile() as prof:
+        build_report(wb)
+    print(prof.report())
+    """
+    profile = StyleProfile()
+    _profiles.append(profile)
+    try:
+        yield profile
+    finally:
+        _profiles.remove(profile)
+
+
+def _counters(sheet):
+    colors = to_hex_color.cache_info()
+    return (
+        len(getattr(sheet, "_cells", ())),
+        sum(info.misses for info in style_cache_info().values()),
+        colors.hits + colors.misses,
+    )
+
+
+def profiled(func):
+    """Record an ``OpStats`` for each outermost call of a styler operation."""
+    name = func.__name__.lstrip("_")
+
+    @wraps(func)
+    def wrapper(self, *args, **kwargs):
+        if self._op_depth or not (self._profile or _profiles):
+            self._op_depth += 1
+            try:
+                return func(self, *args, **kwargs)
+            finally:
+                self._op_depth -= 1
+
+        sheet = self._sheet
+        self._touched = 0
+        modified = self._modified
+        cells, styles, colors = _counters(sheet)
+        start = time.perf_counter()
+        self._op_depth += 1
+        try:
+            result = func(self, *args, **kwargs)
+        finally:
+            self._op_depth -= 1
+
+        elapsed = time.perf_counter() - start
+        cells_after, styles_after, colors_after = _counters(sheet)
+        rec = OpStats(
+            op=name,
+            sheet=getattr(sheet, "title", ""),
+            cells_touched=self._touched,
+            cells_created=max(0, cells_after - cells),
+            cells_modified=self._modified - modified,
+            styles_allocated=max(0, styles_after - styles),
+            color_resolutions=max(0, colors_after - colors),
+            elapsed=elapsed,
+        )
+        if self._profile:
+            self._stats.append(rec)
+        if self._on_op is not None:
+            self._on_op(rec)
+        for profile in _profiles:
+            profile.records.append(rec)
+
+        return result
+
+    return wrapper
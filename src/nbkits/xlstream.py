@@ -0,0 +1,226 @@
+from collections import deque
+
+from openpyxl.cell import Cell
+from openpyxl.styles.cell_style import StyleArray
+
+from .stylecache import intern_border
+from .xlstyler import (
+    _IndexSet,
+    _StyleMerger,
+    _check_scalar,
+    _parse_arg_cols,
+    _parse_fill,
+    _parse_format_styles,
+    _parse_side_opts,
+    _register_style,
+    _set_column_widths,
+    _update_positional_sides,
+)
+
+_BANDS = [None, "header", "body", "footer"]
+
+
+class ExcelStreamStyler:
+    """Styler for the worksheets of ``Workbook(write_only=True)``.
+
+    The styling rules are declared up front against row bands, "header" (the
+    first ``header`` rows), "body", "footer" (the last ``footer`` rows) or
+    None for the whole table, then the data rows are fed through ``rows()``
+    which yields them as styled cells::
+
+        s = xlstream(ws, header=1).format(band="header", bold=True)
+        s.border(band="body", sides="outside")
+        for cells in s.rows(data):
+            ws.append(cells)
+
+    Only ``footer + 1`` rows are held back to resolve the last rows of the
+    bands, so memory does not grow with the number of rows.
+    """
+
+    def __init__(self, sheet, header: int = 0, footer: int = 0, ncols=None):
+        if not (isinstance(header, int) and header >= 0):
+            raise ValueError("argument 'header' must be a non-negative int")
+
+        if not (isinstance(footer, int) and footer >= 0):
+            raise ValueError("argument 'footer' must be a non-negative int")
+
+        self._sheet = sheet
+        self._header = header
+        self._footer = footer
+        self._ncols = ncols
+        self._rules = []
+        self._templates = {}
+
+    def column_width(
+        self,
+        width: float | int | list[float | int],
+        col: list[int] | list[str] | None = None,
+        group: bool = False,
+    ):
+        if col is None and isinstance(width, list):
+            col = range(1, 1 + len(width))
+        elif col is None and self._ncols is None:
+            raise ValueError("argument 'col' is required when 'ncols' is unknown")
+
+        col = _parse_arg_cols(col=col, max_column=self._ncols)
+        if isinstance(width, (list, tuple)):
+            if len(width) != len(col):
+                msg = (
+                    "The lists, 'width' and 'cols' , must be of equal length:"
+                    f" {len(width)} != {len(col)}"
+                )
+                raise ValueError(msg)
+        else:
+            width = [width] * len(col)
+
+        _set_column_widths(self._sheet, dict(zip(col, width)), group=group)
+
+        return self
+
+    def format(self, col=None, band=None, **kwargs):
+        """Accept the style arguments of ``ExcelSheetStyler.format``."""
+        _check_scalar(kwargs, "xlstream")
+        styles = _parse_format_styles(**kwargs)
+        return self._add_rule("styles", col, band, self._merger(styles))
+
+    def patten_fill(
+        self,
+        col=None,
+        band=None,
+        type: str | None = None,
+        color: str | None = None,
+        background_color: str | None = None,
+    ):
+        """Replace the fill of the cells; ``type=None`` clears it."""
+        kwargs = dict(type=type, color=color, background_color=background_color)
+        _check_scalar(kwargs, "xlstream")
+        fill = _parse_fill(**kwargs)
+        return self._add_rule("styles", col, band, self._merger({"fill": fill}))
+
+    def border(self, col=None, band=None, **kwargs):
+        """Accept the side arguments of ``ExcelSheetStyler.border``.
+
+        The outside sides are drawn on the first and last rows of the band and
+        the inside sides between its rows, as each row's position is known.
+        """
+        side_opts = _parse_side_opts(**kwargs)
+        return self._add_rule("border", col, band, side_opts)
+
+    def _merger(self, styles):
+        return _StyleMerger(self._sheet.parent, styles)
+
+    def _add_rule(self, kind, col, band, payload):
+        if band not in _BANDS:
+            values = ", ".join(repr(b) for b in _BANDS)
+            raise ValueError(f"argument 'band' must be one of these values: {values}")
+
+        if col is not None:
+            col = _parse_arg_cols(col=col)
+
+        self._rules.append((kind, col, band, payload))
+        self._templates.clear()
+        return self
+
+    def rows(self, rows):
+        """Yield each row of values as a list of styled cells."""
+        footer = self._footer
+        buffered = deque()
+        idx = 0
+        for values in rows:
+            buffered.append(values)
+            if len(buffered) > footer + 1:
+                yield self._styled_row(idx, buffered.popleft(), None)
+                idx += 1
+
+        n_rows = len(buffered)
+        for k, values in enumerate(buffered):
+            yield self._styled_row(idx, values, n_rows - k - 1)
+            idx += 1
+
+    def _styled_row(self, idx, values, remaining):
+        values = list(values)
+        if self._ncols is None:
+            self._ncols = len(values)
+
+        key = self._row_position(idx, remaining)
+        templates = self._templates.get(key)
+        if templates is None:
+            templates = self._templates[key] = {}
+
+        sheet = self._sheet
+        cells = []
+        for j in range(1, max(len(values), self._ncols) + 1):
+            value = values[j - 1] if j <= len(values) else None
+            template = templates.get(j, False)
+            if template is False:
+                template = templates[j] = self._cell_template(key, j)
+
+            if template is None or isinstance(value, Cell):
+                cells.append(value)
+            else:
+                cells.append(Cell(sheet, 1, 1, value, style_array=template))
+
+        return cells
+
+    def _row_position(self, idx, remaining):
+        """Return (band, first in band, last in band, first row, last row).
+
+        ``remaining`` is the number of rows after this one, None if there are
+        more than ``footer``.
+        """
+        header, footer = self._header, self._footer
+        is_last = remaining == 0
+        if idx < header:
+            return ("header", idx == 0, idx == header - 1 or is_last, idx == 0, is_last)
+
+        if remaining is not None and remaining < footer:
+            first = remaining == footer - 1 or idx == header
+            return ("footer", first, is_last, idx == 0, is_last)
+
+        last = remaining == footer if remaining is not None else False
+        return ("body", idx == header, last, idx == 0, is_last)
+
+    def _cell_template(self, key, j):
+        row_band, band_first, band_last, table_first, table_last = key
+        template, border_kwargs = None, None
+        for kind, col, band, payload in self._rules:
+            if band is not None and band != row_band:
+                continue
+
+            if col is None:
+                col = _IndexSet.span(1, self._ncols)
+
+            if j not in col:
+                continue
+
+            if kind == "styles":
+                template = payload.resolve(template)
+                continue
+
+            if border_kwargs is None:
+                border_kwargs = {}
+
+            top, bottom = (
+                (band_first, band_last) if band else (table_first, table_last)
+            )
+            _update_positional_sides(
+                border_kwargs,
+                payload,
+                top=top,
+                bottom=bottom,
+                left=j == col.first,
+                right=j == col.last,
+            )
+
+        if border_kwargs is not None:
+            template = StyleArray() if template is None else StyleArray(template)
+            slot, idx = _register_style(
+                self._sheet.parent, "border", intern_border(**border_kwargs)
+            )
+            template[slot] = idx
+
+        return template
+
+
+def xlstream(sheet, header: int = 0, footer: int = 0, ncols=None):
+    return ExcelStreamStyler(sheet, header=header, footer=footer, ncols=ncols)
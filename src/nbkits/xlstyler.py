@@ -1,9 +1,38 @@
+import re
+from bisect import bisect_right
+from contextlib import contextmanager
+from copy import copy
+from itertools import islice, repeat
+from unicodedata import east_asian_width
+
+from openpyxl.cell import Cell
+from openpyxl.formatting.rule import CellIsRule, ColorScaleRule, DataBarRule
+from openpyxl.worksheet.dimensions import ColumnDimension
 from openpyxl.worksheet.worksheet import Worksheet
-from openpyxl.styles import Border, Alignment, Side, Font, PatternFill
+from openpyxl.styles.cell_style import StyleArray
+from openpyxl.styles.numbers import (
+    BUILTIN_FORMATS,
+    BUILTIN_FORMATS_MAX_SIZE,
+    BUILTIN_FORMATS_REVERSE,
+    is_date_format,
+)
+from openpyxl.styles import Alignment, Font, GradientFill, PatternFill
 from openpyxl.styles.alignment import horizontal_alignments, vertical_aligments
+from openpyxl.styles.builtins import styles as builtin_styles
+from openpyxl.styles.named_styles import NamedStyle
 from openpyxl.utils import get_column_letter, column_index_from_string
-
+from openpyxl.utils.cell import range_boundaries
+
+from .stylecache import (
+    STYLE_CACHE_SIZE,
+    intern_alignment,
+    intern_border,
+    intern_fill,
+    intern_font,
+    intern_side,
+)
 from .utils import to_hex_color
+from .xlprofile import OpStats, profiled
 
 _LINE_STYLES = [
     "thin",
@@ -23,19 +52,341 @@ _LINE_STYLES = [
 
 
 class ExcelSheetStyler:
-    def __init__(self, sheet: Worksheet):
+    def __init__(
+        self,
+        sheet: Worksheet,
+        profile: bool = False,
+        on_op=None,
+        dimension_styles: bool = False,
+        ignore_style_only: bool = False,
+    ):
         self._sheet = sheet
+        self._dimension_styles = dimension_styles
+        self._ignore_style_only = ignore_style_only
+        self._used_ranges = {}
+        self._pending = None
+        self._profile = profile or on_op is not None
+        self._on_op = on_op
+        self._stats = []
+        self._op_depth = 0
+        self._touched = 0
+        self._modified = 0
+
+    def stats(self) -> list[OpStats]:
+        """The cost of each operation, when created with profile=True."""
+        return list(self._stats)
+
+    @property
+    def cells_modified(self) -> int:
+        """The number of cells and dimensions whose style this styler changed.
+
+        Cells that already had the style they were given are not written and
+        not counted, so re-running the same styling modifies nothing.
+        """
+        return self._modified
+
+    def used_range(self, ignore_style_only: bool | None = None) -> tuple[int, int]:
+        """Return the last row and column of the cells holding data.
+
+        Unlike ``max_row`` and ``max_column``, empty cells without a style, as
+        left by reading ``ws.cell()``, don't count, nor do styled empty cells
+        with ``ignore_style_only``, which defaults to the styler's option. The
+        omitted rows and columns of the styling methods default to this range.
+
+        The result is cached until the sheet gets new cells or this styler
+        changes a style; a value written into an existing empty cell isn't
+        noticed.
+        """
+        if ignore_style_only is None:
+            ignore_style_only = self._ignore_style_only
+
+        used = self._cells_used_range(ignore_style_only)
+        if self._pending and not ignore_style_only:  # the cells the batch styles
+            used = (
+                max(used[0], *(op[0].last for op in self._pending)),
+                max(used[1], *(op[1].last for op in self._pending)),
+            )
+        return used
+
+    def _cells_used_range(self, ignore_style_only):
+        sheet = self._sheet
+        version = (len(sheet._cells), self._modified)
+        cached = self._used_ranges.get(ignore_style_only)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        max_row = max_col = 0
+        for (i, j), cell in sheet._cells.items():
+            if cell._value is None:
+                if ignore_style_only:
+                    continue
+                style = cell._style
+                if style is None or not any(style):
+                    continue
+            if i > max_row:
+                max_row = i
+            if j > max_col:
+                max_col = j
+
+        used = (max(max_row, 1), max(max_col, 1))  # an empty sheet has A1
+        self._used_ranges[ignore_style_only] = (version, used)
+        return used
+
+    @contextmanager
+    def batch(self):
+        """Defer cell style writes and apply them once on exit.
+
+        The ``format``, ``patten_fill``, ``border`` and ``apply_style`` calls
+        inside the block are queued, and applied in one pass over their cells
+        on exit, so each cell gets its final style written once::
+
+            with xlstyle(ws).batch() as s:
+                s.format(row=1, bold=True).border(sides="outside")
+
+        Other calls, e.g. per-cell arguments or ``copy_style``, apply the
+        queue first and then run at once.
+        """
+        if self._pending is not None:  # nested batch, the outer one applies
+            yield self
+            return
+
+        self._pending = []
+        try:
+            yield self
+        except BaseException:
+            self._pending = None
+            raise
+
+        pending, self._pending = self._pending, None
+        if pending:
+            self._apply_batch(pending)
+
+    def _flush_pending(self):
+        """Apply the queued styles of a batch, which goes on."""
+        if self._pending:
+            pending, self._pending = self._pending, []
+            self._apply_batch(pending)
+
+    @profiled
+    def _apply_batch(self, ops):
+        """Apply the queued ops, each a (rows, cols, edges, resolve) tuple.
+
+        Each row is cut into runs of columns covered by the same ops at the
+        same border positions, and the new style array of each distinct
+        (ops, current style array) is resolved once through the ops in order.
+        """
+        sheet = self._sheet
+        cells = sheet._cells
+        rows = _IndexSet([span for op in ops for span in op[0].intervals])
+        layouts = {}
+        finals = {}
+        modified = touched = 0
+        for i in rows:
+            active = tuple(
+                (k, None if edges is None else (i in edges[0], i in edges[1]))
+                for k, (row, _, edges, _) in enumerate(ops)
+                if i in row
+            )
+            segments = layouts.get(active)
+            if segments is None:
+                segments = layouts[active] = _column_segments(ops, active)
+
+            for lo, hi, key in segments:
+                touched += hi - lo + 1
+                for j in range(lo, hi + 1):
+                    cell = cells.get((i, j))
+                    style = None if cell is None else cell._style
+                    memo_key = (key, None if style is None else style.tobytes())
+                    final = finals.get(memo_key)
+                    if final is None:
+                        new = style
+                        for k, pos in key:
+                            new = ops[k][3](new, pos)
+                        final = finals[memo_key] = (new, any(new))
+
+                    new, styled = final
+                    if cell is None:
+                        cells[(i, j)] = Cell(sheet, row=i, column=j, style_array=new)
+                        modified += styled
+                    elif style is None:
+                        cell._style = StyleArray(new)
+                        modified += styled
+                    elif style != new:
+                        style[:] = new
+                        modified += 1
+        self._modified += modified
+        self._touched += touched
+
+        if cells:
+            sheet._current_row = max(sheet._current_row, rows.last)
+
+    def _select_cols(self, col):
+        max_column = self.used_range()[1] if col is None else None
+        return _parse_arg_cols(col=col, max_column=max_column)
+
+    def _select_rows(self, row, skip_rows=None, skip_header=None, skip_footer=None):
+        need_max_row = row is None or skip_footer is not None
+        return _parse_arg_rows(
+            row=row,
+            max_row=self.used_range()[0] if need_max_row else None,
+            skip_rows=skip_rows,
+            skip_header=skip_header,
+            skip_footer=skip_footer,
+        )
 
+    def _set_selection_styles(
+        self, col, row, styles, skip_rows, skip_header, skip_footer
+    ):
+        """Apply styles to the selected cells, or to the selected dimensions.
+
+        With ``dimension_styles`` enabled, a selection of whole columns (no row
+        arguments) or whole rows (no column argument) styles the column or row
+        dimensions and the cells already present in them, so empty cells are
+        not created.
+
+        Only the cells present now get the style. Cells openpyxl creates later,
+        e.g. by ``ws.append``, are saved with the default style, which Excel
+        shows instead of the column's or row's, so style after filling in.
+        """
+        no_skips = skip_rows is None and skip_header is None and skip_footer is None
+        if self._dimension_styles and no_skips:
+            if row is None and col is not None:
+                self._set_dimension_styles("column", _parse_arg_cols(col), styles)
+                return
+
+            if col is None and row is not None:
+                self._set_dimension_styles("row", _parse_arg_rows(row), styles)
+                return
+
+        col = self._select_cols(col)
+        row = self._select_rows(row, skip_rows, skip_header, skip_footer)
+        self._set_range_styles(row, col, styles)
+
+    def _set_dimension_styles(self, axis, idxs, styles):
+        if not styles:
+            return
+
+        self._flush_pending()
+        sheet = self._sheet
+        # unstyled empty cells past the used range aren't worth restyling
+        last_row, last_col = self.used_range(ignore_style_only=False)
+        cells = sheet._cells
+        if axis == "column":
+            lines = range(1, last_row + 1)
+            coords = ((i, j) for j in idxs for i in lines)
+        else:
+            lines = range(1, last_col + 1)
+            coords = ((i, j) for i in idxs for j in lines)
+
+        merger = _StyleMerger(sheet.parent, styles)
+        if axis == "column":
+            created = _split_column_groups(sheet, idxs)
+            dims = sheet.column_dimensions
+            for k in idxs:
+                letter = get_column_letter(k)
+                is_new = letter not in dims
+                dim = dims[letter]
+                if is_new:  # openpyxl gives new columns a custom width of 13
+                    dim.width = 0
+                self._modified += merger.apply(dim)
+            _coalesce_columns(sheet, created)
+        else:
+            for k in idxs:
+                self._modified += merger.apply(sheet.row_dimensions[k])
+        self._touched += len(idxs)
+
+        resolve = merger.resolve
+        template = None  # resolved on the first unstyled cell
+        modified = touched = 0
+        for key in coords:
+            cell = cells.get(key)
+            if cell is None:
+                continue
+
+            touched += 1
+            style = cell._style
+            if style is None:
+                if template is None:
+                    template = resolve(None)
+                    styled = any(template)
+                cell._style = StyleArray(template)
+                modified += styled
+                continue
+
+            new = resolve(style)
+            if style != new:
+                style[:] = new
+                modified += 1
+        self._modified += modified
+        self._touched += touched
+
+    def _set_range_styles(self, row, col, styles):
+        """Apply the same styles to every cell of row x col.
+
+        The new style array of each distinct existing one is resolved once and
+        copied onto the cells whose style it changes.
+        """
+        if not styles or not row or not col:
+            return
+
+        self._touched += len(row) * len(col)
+
+        _check_bounds(row.first, row.last, col.first, col.last)
+
+        sheet = self._sheet
+        resolve = _StyleMerger(sheet.parent, styles).resolve
+        if self._pending is not None:
+            self._pending.append((row, col, None, lambda style, pos: resolve(style)))
+            return
+
+        cells = sheet._cells
+        template = None  # resolved on the first unstyled cell
+        modified = 0
+        for i in row:
+            for j in col:
+                cell = cells.get((i, j))
+                style = None if cell is None else cell._style
+                if style is None:
+                    if template is None:
+                        template = resolve(None)
+                        styled = any(template)  # not if it resolves to defaults
+                    if cell is None:
+                        cells[(i, j)] = Cell(
+                            sheet, row=i, column=j, style_array=template
+                        )
+                    else:
+                        cell._style = StyleArray(template)
+                    modified += styled
+                    continue
+
+                new = resolve(style)
+                if style != new:  # skip the cells that already have the style
+                    style[:] = new
+                    modified += 1
+        self._modified += modified
+
+        if cells:
+            sheet._current_row = max(sheet._current_row, row.last)
+
+    @profiled
     def column_width(
         self,
         width: float | int | list[float | int],
         col: list[int] | list[str] | None = None,
+        group: bool = False,
     ):
+        """Set the width of the columns.
+
+        With ``group``, adjacent columns of the same width share one
+        dimension spanning them, e.g. ``column_dimensions["B"]`` for "B:GQ",
+        which saves one ``<col>`` for a wide sheet. The other letters of a
+        span then have no dimension of their own to read or set.
+        """
         sheet = self._sheet
         if col is None and isinstance(width, list):
             col = range(1, 1 + len(width))
         else:
-            col = _parse_arg_cols(col=col, max_column=sheet.max_column)
+            col = self._select_cols(col)
 
         if isinstance(width, (list, tuple)):
             if len(width) != len(col):
@@ -46,14 +397,14 @@ class ExcelSheetStyler:
                 raise ValueError(msg)
 
         elif isinstance(width, (int, float)):
-            width = [width] * len(col)
+            width = repeat(width, len(col))
 
-        for i, w in zip(col, width):
-            dim = sheet.column_dimensions[get_column_letter(i)]
-            dim.width = w
+        _set_column_widths(sheet, dict(zip(col, width)), group=group)
+        self._touched += len(col)
 
         return self
 
+    @profiled
     def row_height(
         self,
         height: float | int | list[float | int],
@@ -61,15 +412,25 @@ class ExcelSheetStyler:
         skip_rows: list[int] = None,
         skip_header: int | None = None,
         skip_footer: int = None,
+        default: bool = False,
     ):
+        """Set the height of the rows.
+
+        With ``default``, ``height`` becomes the sheet's default row height
+        instead, which needs no dimension per row; the heights set on single
+        rows are cleared.
+        """
         sheet = self._sheet
-        row = _parse_arg_rows(
-            row=row,
-            max_row=sheet.max_row,
-            skip_rows=skip_rows,
-            skip_header=skip_header,
-            skip_footer=skip_footer,
-        )
+        if default:
+            _check_default_height(height, row, skip_rows, skip_header, skip_footer)
+            sheet.sheet_format.defaultRowHeight = height
+            sheet.sheet_format.customHeight = True
+            for dim in sheet.row_dimensions.values():
+                dim.height = None
+            self._touched += 1
+            return self
+
+        row = self._select_rows(row, skip_rows, skip_header, skip_footer)
 
         if isinstance(height, (list, tuple)):
             if len(height) != len(row):
@@ -80,13 +441,84 @@ class ExcelSheetStyler:
                 raise ValueError(msg)
 
         elif isinstance(height, (int, float)):
-            height = [height] * len(row)
+            height = repeat(height, len(row))
 
         for i, h in zip(row, height):
-            self._sheet.row_dimensions[i].height = h
+            sheet.row_dimensions[i].height = h
+            self._touched += 1
+
+        return self
+
+    @profiled
+    def autofit(
+        self,
+        col=None,
+        sample: int | None = None,
+        min: float = 6,  # noqa: A002
+        max: float = 60,  # noqa: A002
+        padding: float = 2,
+        skip_rows=None,
+        skip_header: int | None = None,
+        skip_footer=None,
+    ):
+        """Set the column widths to fit the widest value of each column.
+
+        The width of a value is estimated from its displayed text, by its
+        number format, with CJK characters counted double and scaled by the
+        font size. With ``sample``, only about that many rows are read,
+        evenly spread over the sheet. Columns without values are left as is.
+        """
+        if sample is not None and sample < 1:
+            raise ValueError(f"'sample' must be at least 1: {sample}")
+
+        sheet = self._sheet
+        cols = self._select_cols(col)
+        skipping = not (skip_rows is None and skip_header is None and skip_footer is None)
+        rows = None
+        if sample is not None or skipping:
+            rows = self._select_rows(None, skip_rows, skip_header, skip_footer)
+        sampled = sample is not None and sample < len(rows)
+
+        wb = sheet.parent
+        measures = {}
+
+        def measure(cell):
+            style = cell._style
+            key = (style[0], style[3]) if style is not None else (0, 0)
+            found = measures.get(key)
+            if found is None:
+                found = measures[key] = _width_measure(wb, *key)
+            return found(cell._value)
+
+        widest = {}
+        cells = sheet._cells
+        if sampled:
+            col_list = list(cols)
+            for i in _spread_rows(rows, sample):
+                for j in col_list:
+                    cell = cells.get((i, j))
+                    if cell is not None and cell._value is not None:
+                        w = measure(cell)
+                        if w > widest.get(j, 0):
+                            widest[j] = w
+        else:
+            for (i, j), cell in cells.items():
+                if cell._value is None or j not in cols:
+                    continue
+                if rows is not None and i not in rows:
+                    continue
+                w = measure(cell)
+                if w > widest.get(j, 0):
+                    widest[j] = w
+
+        if widest:
+            fitted = sorted(widest)
+            widths = [_clamp(widest[j] + padding, min, max) for j in fitted]
+            self.column_width(widths, col=fitted)
 
         return self
 
+    @profiled
     def border(
         self,
         col=None,
@@ -105,113 +537,125 @@ class ExcelSheetStyler:
         skip_rows=None,
         skip_header: int | None = None,
         skip_footer=None,
+        groups: str | int | list[int] | None = None,
     ):
-        sheet = self._sheet
-        max_column, max_row = sheet.max_column, sheet.max_row
-        col = _parse_arg_cols(col=col, max_column=max_column)
-        row = _parse_arg_rows(
-            row=row,
-            max_row=max_row,
+        """Draw the border sides of the selected range.
+
+        With ``groups``, the selected rows are split into groups and each one
+        is bordered as a range of its own, e.g. ``sides="outside", h="thin"``
+        boxes every group and rules the rows inside it. ``groups`` is a key
+        column, whose runs of equal values make the groups, or a list of the
+        number of rows of each group.
+        """
+        side_opts = _parse_side_opts(
+            sides=sides, t=t, l=l, b=b, r=r, h=h, v=v, u=u, d=d, ls=ls, c=c
+        )
+        self._set_border(
+            col,
+            row,
+            _BorderVariants(side_opts),
+            groups=groups,
             skip_rows=skip_rows,
             skip_header=skip_header,
             skip_footer=skip_footer,
         )
+        return self
 
-        side_opts = {}
-        if sides is not None:
-            if not isinstance(sides, str):
-                raise ValueError(
-                    "Argument 'sides' has invalid side flags. "
-                    "The flag must be one of 't', 'r', 'b', "
-                    "'l', 'h', 'v', 'u', and 'd'."
-                )
-
-            sides = sides.lower()
-            if sides == "all":
-                sides = "trblhv"
-            elif sides == "outside":
-                sides = "trbl"
-            elif sides == "inside":
-                sides = "hv"
-
-            _unknowns = []
-            for flag in sides:
-                if flag in _side_flag_map:
-                    side_opts[_side_flag_map[flag]] = True
-                else:
-                    _unknowns.append(flag)
-            if _unknowns:
-                _flags = ", ".join([f"'{c}'" for c in _unknowns])
-                raise ValueError(
-                    f"unknown side flag: {_flags}"
-                    "The flag must be one of 't', 'r', 'b', "
-                    "'l', 'h', 'v', 'u', and 'd'."
-                )
-
-        for value, attr_name in [
-            (t, "top"),
-            (r, "right"),
-            (b, "bottom"),
-            (l, "left"),
-            (h, "horizontal"),
-            (v, "vertical"),
-        ]:
-            _parse_border_side_option(side_opts, value, attr_name)
+    def _set_border(self, col, row, variants, groups=None, **skips):
+        col = self._select_cols(col)
+        row = self._select_rows(row, **skips)
+        if not row:
+            return
 
-        if u is not None:
-            if isinstance(u, bool):
-                side_opts["diagonalUp"] = u
-            else:
-                raise ValueError(
-                    "The diagnoal-up side argument 'u' must be a True or False"
-                )
+        _check_bounds(row.first, row.last, col.first, col.last)
 
-        if d is not None:
-            if isinstance(d, bool):
-                side_opts["diagonalDown"] = d
-            else:
-                raise ValueError(
-                    "The diagnoal-down side argument 'd' must be a True or False"
-                )
-
-        _normalize_side_opts(side_opts, ls=ls, c=c)
+        if groups is None:
+            firsts, lasts = {row.first}, {row.last}
+        else:
+            spans = self._group_spans(row, groups)
+            firsts, lasts = {a for a, _ in spans}, {b for _, b in spans}
 
-        min_row, max_row = min(row), max(row)
-        min_col, max_col = min(col), max(col)
+        min_col, max_col = col.first, col.last
+        self._touched += len(row) * len(col)
+        sheet = self._sheet
+        borders = sheet.parent._borders
+        merged = {}
+        if self._pending is not None:
+
+            def resolve(style, pos):
+                base = 0 if style is None else style[2]
+                border_id = merged.get((base, pos))
+                if border_id is None:
+                    border = variants.merge(borders[base], pos)
+                    border_id = merged[(base, pos)] = borders.add(border)
+                new = StyleArray() if style is None else StyleArray(style)
+                new[2] = border_id
+                return new
+
+            self._pending.append((row, col, (firsts, lasts), resolve))
+            return
+
+        modified = 0
         for i in row:
+            top, bottom = i in firsts, i in lasts
             for j in col:
-                cell = sheet.cell(i, j)
-                kwargs = _get_border_args(cell.border)
-
-                middle_sides = set(_OUTSIDES)
-                if i == min_row:
-                    _update_kwargs(kwargs, side_opts, "top")
-                    middle_sides.remove("top")
-
-                if i == max_row:
-                    _update_kwargs(kwargs, side_opts, "bottom")
-                    middle_sides.remove("bottom")
-
-                if j == min_col:
-                    _update_kwargs(kwargs, side_opts, "left")
-                    middle_sides.remove("left")
-
-                if j == max_col:
-                    _update_kwargs(kwargs, side_opts, "right")
-                    middle_sides.remove("right")
-
-                for side in middle_sides:
-                    if side in ["top", "bottom"]:
-                        if "horizontal" in side_opts:
-                            kwargs[side] = side_opts["horizontal"]
-                    elif side in ["right", "left"]:
-                        if "vertical" in side_opts:
-                            kwargs[side] = side_opts["vertical"]
-
-                cell.border = Border(**kwargs)
-
-        return self
-
+                pos = (top, bottom, j == min_col, j == max_col)
+                style = _cell_style_array(sheet, i, j)
+                key = (style[2], pos)
+                border_id = merged.get(key)
+                if border_id is None:
+                    border = variants.merge(borders[style[2]], pos)
+                    border_id = merged[key] = borders.add(border)
+                if style[2] != border_id:
+                    style[2] = border_id
+                    modified += 1
+        self._modified += modified
+
+    def _banded_rows(self, row, groups, skip_rows, skip_header, skip_footer):
+        """Return the first, third, ... group of the selected rows."""
+        rows = self._select_rows(row, skip_rows, skip_header, skip_footer)
+        spans = self._group_spans(rows, groups)
+        return rows.difference(_IndexSet(map(tuple, spans[1::2])))
+
+    def _group_spans(self, row, groups):
+        """Split the selected rows into groups, return their (first, last) rows."""
+        spans = []
+        if isinstance(groups, (str, int)):
+            key_col = _parse_arg_cols(col=groups)
+            if len(key_col) != 1 or key_col.first < 1:
+                raise ValueError(f"'groups' must be a single key column: {groups!r}")
+
+            j = key_col.first
+            cells = self._sheet._cells
+            key = None
+            for i in row:
+                cell = cells.get((i, j))
+                value = cell._value if cell is not None else None
+                if spans and value == key:
+                    spans[-1][1] = i
+                else:
+                    spans.append([i, i])
+                    key = value
+            return spans
+
+        lengths = list(groups)
+        if sum(lengths) != len(row) or any(n < 1 for n in lengths):
+            msg = (
+                "The group lengths must be positive and add up to the number of"
+                f" rows: {sum(lengths)} != {len(row)}"
+            )
+            raise ValueError(msg)
+
+        rows = iter(row)
+        for n in lengths:
+            first = next(rows)
+            last = first
+            for last in islice(rows, n - 1):
+                pass
+            spans.append([first, last])
+        return spans
+
+    @profiled
     def format(
         self,
         col=None,
@@ -219,7 +663,7 @@ class ExcelSheetStyler:
         ha=None,
         va=None,
         wrap_text=None,
-        indent=0,
+        indent=None,
         text_rotation=None,
         shrink_to_fit=None,
         number_format=None,
@@ -238,139 +682,1177 @@ class ExcelSheetStyler:
         skip_header: int | None = None,
         skip_footer=None,
     ):
-        sheet = self._sheet
-        max_column, max_row = sheet.max_column, sheet.max_row
-        col = _parse_arg_cols(col=col, max_column=max_column)
-        row = _parse_arg_rows(
-            row=row,
-            max_row=max_row,
+        """Set the alignment, number format, font and background of cells.
+
+        Only the given attributes change, e.g. ``bold=True`` keeps the font
+        name, size and color each cell already has.
+
+        Any style argument may also be a 2-D array (nested lists or a NumPy
+        array) shaped like the selected rows x columns, or a callable of the
+        cell value, to style each cell by its own value. Cells are grouped by
+        their distinct argument values and each distinct style is built once::
+
+            xlstyle(ws).format(
+                col="B:D", skip_header=1, color=lambda v: "r" if v < 0 else None
+            )
+        """
+        opts = dict(
+            ha=ha,
+            va=va,
+            wrap_text=wrap_text,
+            indent=indent,
+            text_rotation=text_rotation,
+            shrink_to_fit=shrink_to_fit,
+            number_format=number_format,
+            family=family,
+            size=size,
+            color=color,
+            background_color=background_color,
+            bold=bold,
+            italic=italic,
+            strike=strike,
+            baseline=baseline,
+            superscript=superscript,
+            subscript=subscript,
+            underline=underline,
+        )
+        varying = {k: v for k, v in opts.items() if _is_varying(v)}
+        if varying:
+            self._set_varying_styles(
+                col,
+                row,
+                _parse_format_styles,
+                opts,
+                varying,
+                skip_rows=skip_rows,
+                skip_header=skip_header,
+                skip_footer=skip_footer,
+            )
+            return self
+
+        styles = _parse_format_styles(**opts)
+        self._set_selection_styles(
+            col, row, styles, skip_rows, skip_header, skip_footer
+        )
+
+        return self
+
+    @profiled
+    def patten_fill(
+        self,
+        col: str | int | list[str] | list[int] | None = None,
+        row: str | int | list[str] | list[int] | None = None,
+        type: str | None = None,
+        color: str | None = None,
+        background_color: str | None = None,
+        skip_rows=None,
+        skip_header: int | None = None,
+        skip_footer=None,
+        groups: str | int | list[int] | None = None,
+    ):
+        """Fill cells with a pattern; the arguments may vary per cell as in
+        ``format``.
+
+        With ``groups``, as in ``border``, only the first, third, ... group of
+        the selected rows are filled, banding the groups.
+        """
+        if groups is not None:
+            row = self._banded_rows(row, groups, skip_rows, skip_header, skip_footer)
+            skip_rows = skip_header = skip_footer = None
+
+        opts = dict(type=type, color=color, background_color=background_color)
+        varying = {k: v for k, v in opts.items() if _is_varying(v)}
+        if varying:
+            self._set_varying_styles(
+                col,
+                row,
+                _parse_fill_styles,
+                opts,
+                varying,
+                skip_rows=skip_rows,
+                skip_header=skip_header,
+                skip_footer=skip_footer,
+            )
+            return self
+
+        self._set_selection_styles(
+            col, row, _parse_fill_styles(**opts), skip_rows, skip_header, skip_footer
+        )
+
+        return self
+
+    @profiled
+    def conditional(
+        self,
+        col=None,
+        row=None,
+        op: str | None = None,
+        value=None,
+        color: str | None = None,
+        background_color: str | None = None,
+        bold: bool | None = None,
+        italic: bool | None = None,
+        strike: bool | None = None,
+        underline: bool | str | None = None,
+        sides: str | None = None,
+        ls: str = "thin",
+        c: str | None = None,
+        color_scale: list[str] | None = None,
+        data_bar: str | None = None,
+        skip_rows=None,
+        skip_header: int | None = None,
+        skip_footer=None,
+    ):
+        """Add a native Excel conditional format to the selected range.
+
+        Exactly one kind of rule is given:
+
+        - ``op`` and ``value``: highlight the cells whose value compares true,
+          with the font, background and border arguments, e.g.
+          ``conditional(col="C", op="<", value=0, color="r")``. ``value`` is a
+          number, a string, an ``=formula``, or a pair for "between".
+        - ``color_scale``: two or three colors for the min, (mid,) max values.
+        - ``data_bar``: the color of a data bar.
+
+        The rule is stored once for the range, the cells are not touched.
+        """
+        rule = _conditional_rule(
+            op=op,
+            value=value,
+            color=color,
+            background_color=background_color,
+            bold=bold,
+            italic=italic,
+            strike=strike,
+            underline=underline,
+            sides=sides,
+            ls=ls,
+            c=c,
+            color_scale=color_scale,
+            data_bar=data_bar,
+        )
+        self._add_conditional(
+            col,
+            row,
+            rule,
             skip_rows=skip_rows,
             skip_header=skip_header,
             skip_footer=skip_footer,
         )
+        return self
 
-        if ha and ha not in horizontal_alignments:
-            values = ", ".join([f"'{v}'" for v in horizontal_alignments])
-            raise ValueError(f"should be one of these values: {values}")
+    def _add_conditional(self, col, row, rule, **skips):
+        col = self._select_cols(col)
+        row = self._select_rows(row, **skips)
+        if not row or not col:
+            return
 
-        if va and va not in vertical_aligments:
-            values = ", ".join([f"'{v}'" for v in vertical_aligments])
-            raise ValueError(f"should be one of these values: {values}")
+        ranges = " ".join(
+            f"{get_column_letter(c0)}{r0}:{get_column_letter(c1)}{r1}"
+            for r0, r1 in row.intervals
+            for c0, c1 in col.intervals
+        )
+        self._sheet.conditional_formatting.add(ranges, rule)
+        self._touched += 1
+
+    @profiled
+    def copy_style(self, src_range: str, dst_range: str, tile: bool = True):
+        """Copy the font, fill, border, alignment and number format of the cells
+        of ``src_range`` onto the cells of ``dst_range``::
+
+            xlstyle(ws).copy_style("A2:F3", "A4:F1000")  # banded rows
+
+        The source pattern is repeated across the destination, or copied once
+        onto its top-left corner without ``tile``. The style ids are copied, so
+        no style object is created. Whole rows or columns, e.g. "2:3" or "B:D",
+        extend to the used range.
+        """
+        src_rows, src_cols = self._select_range(src_range)
+        dst_rows, dst_cols = self._select_range(dst_range)
+        for rows, cols in [(src_rows, src_cols), (dst_rows, dst_cols)]:
+            _check_bounds(rows[0], rows[-1], cols[0], cols[-1])
+        if not tile:
+            dst_rows = dst_rows[: len(src_rows)]
+            dst_cols = dst_cols[: len(src_cols)]
+
+        self._flush_pending()
+        sheet = self._sheet
+        cells = sheet._cells
+        pattern = []
+        for i in src_rows:
+            line = []
+            for j in src_cols:
+                cell = cells.get((i, j))
+                style = cell._style if cell is not None else None
+                if style is None:
+                    line.append(None)
+                else:
+                    line.append([(slot, style[slot]) for slot in _COPIED_SLOTS])
+            pattern.append(line)
+
+        n_rows, n_cols = len(src_rows), len(src_cols)
+        blank = [(slot, 0) for slot in _COPIED_SLOTS]
+        modified = 0
+        for ri, i in enumerate(dst_rows):
+            line = pattern[ri % n_rows]
+            for cj, j in enumerate(dst_cols):
+                ids = line[cj % n_cols]
+                self._touched += 1
+                if ids is None:
+                    if (i, j) not in cells:  # a missing cell already has no style
+                        continue
+                    ids = blank
+                if _stamp_cell(sheet, i, j, ids):
+                    modified += 1
+        self._modified += modified
 
-        font_kwargs = {}
-        if family is not None and isinstance(family, str):
-            font_kwargs["name"] = family
+        return self
 
-        if size is not None and isinstance(size, (float, int)):
-            font_kwargs["size"] = size
+    @profiled
+    def define(
+        self,
+        name: str,
+        sides=None,
+        t=None,
+        l=None,  # noqa: E741
+        b=None,
+        r=None,
+        u: bool | None = None,
+        d: bool | None = None,
+        ls="thin",
+        c: str | None = None,
+        **kwargs,
+    ):
+        """Define a named style of the workbook, to apply by name on any sheet.
+
+        The keyword arguments are those of ``format``, the border arguments
+        those of ``border`` for a single cell, e.g. ``sides="outside"`` boxes
+        each cell::
+
+            s = xlstyle(ws).define("header", bold=True, background_color="tab:blue")
+            s.apply_style("header", row=1)
+
+        The style is registered once as an openpyxl ``NamedStyle`` and all its
+        cells share one entry of the workbook's cell style table. Defining an
+        existing name changes that style; cells keep the old one until it is
+        applied again.
+        """
+        varying = ", ".join(k for k, v in kwargs.items() if _is_varying(v))
+        if varying:
+            raise ValueError(f"a named style can't vary per cell: {varying}")
+
+        wb = self._sheet.parent
+        styles = _parse_format_styles(**kwargs)
+        attrs = {}
+        for attr, base in [
+            ("font", wb._fonts[0]),
+            ("fill", wb._fills[0]),
+            ("alignment", wb._alignments[0]),
+        ]:
+            delta = styles.get(attr)
+            attrs[attr] = base if delta is None else delta.merge(base)
 
-        if color is not None and isinstance(color, str):
-            font_kwargs["color"] = to_hex_color(color)
+        side_opts = _parse_side_opts(
+            sides=sides, t=t, l=l, b=b, r=r, u=u, d=d, ls=ls, c=c
+        )
+        whole = (True, True, True, True)  # a cell alone in its range
+        attrs["border"] = _BorderVariants(side_opts).merge(wb._borders[0], whole)
+        attrs["number_format"] = styles.get("number_format", "General")
+
+        if name in wb._named_styles.names:
+            named = wb._named_styles[name]
+            for attr, value in attrs.items():
+                setattr(named, attr, value)
+        else:
+            wb.add_named_style(NamedStyle(name=name, **attrs))
 
-        if bold is not None and isinstance(bold, bool):
-            font_kwargs["bold"] = bold
+        return self
 
-        if italic is not None and isinstance(italic, bool):
-            font_kwargs["italic"] = italic
+    @profiled
+    def apply_style(
+        self,
+        name: str,
+        col=None,
+        row=None,
+        skip_rows=None,
+        skip_header: int | None = None,
+        skip_footer=None,
+    ):
+        """Give the selected cells a named style, replacing their own styles.
+
+        ``name`` is a style made by ``define``, or a built-in one of Excel
+        such as "Good" or "Percent". Each cell gets a copy of the style's
+        array of ids, nothing else is looked up or built per cell.
+        """
+        wb = self._sheet.parent
+        if name not in wb._named_styles.names:
+            if name not in builtin_styles:
+                raise ValueError(f"'{name}' is not a defined style")
+            wb.add_named_style(builtin_styles[name])
+        template = wb._named_styles[name].as_tuple()
+        styled = any(template)  # not "Normal"
+
+        col = self._select_cols(col)
+        row = self._select_rows(row, skip_rows, skip_header, skip_footer)
+        if not row or not col:
+            return self
+
+        _check_bounds(row.first, row.last, col.first, col.last)
+
+        self._touched += len(row) * len(col)
+        if self._pending is not None:
+            self._pending.append((row, col, None, lambda style, pos: template))
+            return self
 
-        if strike is not None and isinstance(strike, bool):
-            font_kwargs["strike"] = strike
+        sheet = self._sheet
+        cells = sheet._cells
+        modified = 0
+        for i in row:
+            for j in col:
+                cell = cells.get((i, j))
+                if cell is None:
+                    cells[(i, j)] = Cell(sheet, row=i, column=j, style_array=template)
+                    modified += styled
+                elif cell._style is None:
+                    cell._style = StyleArray(template)
+                    modified += styled
+                elif cell._style != template:
+                    cell._style[:] = template
+                    modified += 1
+        self._modified += modified
+
+        if cells:
+            sheet._current_row = max(sheet._current_row, row.last)
+        return self
 
-        if baseline is not None and isinstance(baseline, bool):
-            font_kwargs["vertAlign"] = "baseline"
+    def _select_range(self, cell_range):
+        min_col, min_row, max_col, max_row = range_boundaries(cell_range)
+        if min_row is None or min_col is None:
+            last_row, last_col = self.used_range()
+            if min_row is None:
+                min_row, max_row = 1, last_row
+            if min_col is None:
+                min_col, max_col = 1, last_col
+        return range(min_row, max_row + 1), range(min_col, max_col + 1)
+
+    def _set_varying_styles(self, col, row, parse, opts, varying, **skips):
+        """Apply styles whose arguments are per-cell arrays or callables."""
+        self._flush_pending()
+        sheet = self._sheet
+        col = self._select_cols(col)
+        row = self._select_rows(row, **skips)
+        if not row or not col:
+            return
+
+        names = list(varying)
+        getters = []
+        for name in names:
+            value = varying[name]
+            if callable(value):
+                getters.append((True, value))
+            else:
+                getters.append((False, _as_grid(value, len(row), len(col), name)))
+
+        cells = sheet._cells
+        memo = {}
+        wb = sheet.parent
+        for ri, i in enumerate(row):
+            for cj, j in enumerate(col):
+                cell = cells.get((i, j))
+                value = cell.value if cell is not None else None
+                key = tuple(
+                    func(value) if by_value else func[ri][cj]
+                    for by_value, func in getters
+                )
 
-        if superscript is not None and isinstance(superscript, bool):
-            font_kwargs["vertAlign"] = "superscript"
+                styles = memo.get(key)
+                if styles is None:
+                    styles = parse(**{**opts, **dict(zip(names, key))})
+                    styles = memo[key] = (styles, _StyleMerger(wb, styles))
 
-        if subscript is not None and isinstance(subscript, bool):
-            font_kwargs["vertAlign"] = "subscript"
+                if not styles[0]:
+                    continue
 
-        if underline is not None:
-            if isinstance(underline, bool):
-                underline = "single"
-            elif isinstance(underline, str):
-                if underline not in _UNDERLINE_OPTIONS:
-                    _opts = ", ".join(f"'{c}'" for c in _UNDERLINE_OPTIONS)
-                    raise ValueError(
-                        "argument 'underline' must be a bool True/False or "
-                        f"one of these values: {_opts}"
-                    )
-            font_kwargs["underline"] = underline
+                cell = _cell_style_owner(sheet, i, j)
+                self._modified += styles[1].apply(cell)
+                self._touched += 1
 
-        font = Font(**font_kwargs) if font_kwargs else None
 
-        fill = None
-        if background_color is not None and isinstance(background_color, str):
-            background_color = to_hex_color(background_color)
-            fill = PatternFill(fill_type="solid", start_color=background_color)
+_STYLE_SLOTS = {
+    "font": (0, "_fonts"),
+    "fill": (1, "_fills"),
+    "border": (2, "_borders"),
+    "protection": (4, "_protections"),
+    "alignment": (5, "_alignments"),
+}
 
-        for i in row:
-            for j in col:
-                cell = sheet.cell(i, j)
-                if ha or va or wrap_text or indent or shrink_to_fit or text_rotation:
-                    cell.alignment = Alignment(
-                        horizontal=ha,
-                        vertical=va,
-                        wrap_text=wrap_text,
-                        indent=indent,
-                        shrink_to_fit=shrink_to_fit,
-                        text_rotation=text_rotation,
-                    )
-
-                if number_format is not None:
-                    cell.number_format = number_format
-
-                if font is not None:
-                    cell.font = font
-
-                if fill is not None:
-                    cell.fill = fill
+# the slots of font, fill, border, number format and alignment
+_COPIED_SLOTS = (0, 1, 2, 3, 5)
+
+
+def _check_default_height(height, row, skip_rows, skip_header, skip_footer):
+    no_skips = skip_rows is None and skip_header is None and skip_footer is None
+    if row is not None or not no_skips:
+        raise ValueError("a default row height applies to every row")
+    if not isinstance(height, (int, float)):
+        raise ValueError(f"a default row height must be a number: {height!r}")
+
+
+def _column_segments(ops, active):
+    """Cut a row into runs of columns covered by the same ``active`` ops.
+
+    ``active`` holds the (op index, border row edges) of the ops on the row.
+    Return (first, last, key) per run, ``key`` the (op index, border
+    position) of the ops covering it. A border's first and last columns
+    are runs of their own.
+    """
+    cuts = set()
+    for k, edges in active:
+        col = ops[k][1]
+        for start, stop in col.intervals:
+            cuts.update((start, stop + 1))
+        if edges is not None:
+            cuts.update((col.first + 1, col.last))
+
+    cuts = sorted(cuts)
+    segments = []
+    for lo, stop in zip(cuts, cuts[1:]):
+        key = []
+        for k, edges in active:
+            col = ops[k][1]
+            if lo in col:
+                if edges is not None:
+                    edges = (*edges, lo == col.first, lo == col.last)
+                key.append((k, edges))
+        if key:
+            segments.append((lo, stop - 1, tuple(key)))
+    return segments
+
+
+def _register_style(wb, name, value):
+    """Add a style object to the workbook's tables, return its (slot, id)."""
+    if name == "number_format":
+        idx = BUILTIN_FORMATS_REVERSE.get(value)
+        if idx is None:
+            idx = wb._number_formats.add(value) + BUILTIN_FORMATS_MAX_SIZE
+        return 3, idx
+
+    slot, collection = _STYLE_SLOTS[name]
+    return slot, getattr(wb, collection).add(value)
+
+
+class _StyleDelta:
+    """Attribute changes merged into a cell's existing font, fill or alignment.
+
+    ``format(bold=True)`` only turns on bold, the name, size and color the
+    cell already has are kept. Each distinct base object is merged once.
+    """
+
+    __slots__ = ("changes", "_merged")
+
+    def __init__(self, **changes):
+        self.changes = changes
+        self._merged = {}
+
+    def __getstate__(self):
+        return self.changes
+
+    def __setstate__(self, changes):
+        self.changes = changes
+        self._merged = {}
+
+    def merge(self, base):
+        found = self._merged.get(id(base))
+        if found is not None:
+            return found[1]
+
+        if len(self._merged) >= STYLE_CACHE_SIZE:
+            self._merged.clear()
+
+        if isinstance(base, GradientFill):  # the fill changes are a pattern's
+            merged = PatternFill()
+        else:
+            merged = copy(base)
+        for name, value in self.changes.items():
+            setattr(merged, name, value)
+        merged = _intern_style(merged)
+        self._merged[id(base)] = (base, merged)  # keep base alive for its id
+        return merged
 
-        return self
 
-    def patten_fill(
-        self,
-        col: str | int | list[str] | list[int] | None = None,
-        row: str | int | list[str] | list[int] | None = None,
-        type: str | None = None,
-        color: str | None = None,
-        background_color: str | None = None,
-        skip_rows=None,
-        skip_header: int | None = None,
-        skip_footer=None,
-    ):
-        sheet = self._sheet
-        col = _parse_arg_cols(col=col, max_column=sheet.max_column)
-        row = _parse_arg_rows(
-            row=row,
-            max_row=sheet.max_row,
-            skip_rows=skip_rows,
-            skip_header=skip_header,
-            skip_footer=skip_footer,
+_INTERNS = {Font: intern_font, PatternFill: intern_fill, Alignment: intern_alignment}
+
+
+def _intern_style(obj):
+    """Return the shared instance equal to a font, pattern fill or alignment."""
+    intern = _INTERNS.get(type(obj))
+    if intern is None:  # e.g. a gradient fill
+        return obj
+
+    names = type(obj).__attrs__ + type(obj).__elements__
+    return intern(**{name: getattr(obj, name) for name in names})
+
+
+class _StyleMerger:
+    """Resolve the style array of a cell from its current one.
+
+    ``styles`` maps a style name to an object that replaces the cell's, a
+    ``_StyleDelta`` merged into the cell's, or for "number_format" a format
+    string. The result is memoized by the current style array, so a call
+    merges once per distinct existing style, not once per cell.
+    """
+
+    __slots__ = ("_ids", "_deltas", "_memo")
+
+    def __init__(self, wb, styles):
+        self._ids = []
+        self._deltas = []
+        for name, value in styles.items():
+            if isinstance(value, _StyleDelta):
+                slot, collection = _STYLE_SLOTS[name]
+                self._deltas.append((slot, getattr(wb, collection), value))
+            else:
+                self._ids.append(_register_style(wb, name, value))
+        self._memo = {}
+
+    def resolve(self, style):
+        """Return the new style array for ``style``, None for an unstyled cell.
+
+        The returned array is shared, copy it before changing it.
+        """
+        key = None if style is None else style.tobytes()
+        new = self._memo.get(key)
+        if new is None:
+            new = StyleArray() if style is None else StyleArray(style)
+            for slot, idx in self._ids:
+                new[slot] = idx
+            for slot, table, delta in self._deltas:
+                new[slot] = table.add(delta.merge(table[new[slot]]))
+            self._memo[key] = new
+        return new
+
+    def apply(self, obj) -> bool:
+        """Restyle a cell or a row or column dimension, return if it changed."""
+        style = obj._style
+        new = self.resolve(style)
+        if style is None:
+            obj._style = StyleArray(new)
+            return any(new)
+
+        if style == new:
+            return False
+        style[:] = new
+        return True
+
+
+def _is_varying(value):
+    if callable(value) or isinstance(value, (list, tuple)):
+        return True
+    return type(value).__module__ == "numpy" and getattr(value, "ndim", 0) == 2
+
+
+def _check_scalar(kwargs, backend):
+    """Reject the per-cell arguments a styler of ``backend`` can't apply."""
+    varying = ", ".join(k for k, v in kwargs.items() if _is_varying(v))
+    if varying:
+        msg = f"per-cell arguments are not supported by {backend}: {varying}"
+        raise ValueError(msg)
+
+
+def _as_grid(value, n_rows, n_cols, name):
+    """Return a per-cell argument as nested lists of n_rows x n_cols."""
+    if type(value).__module__ == "numpy":
+        value = value.tolist()
+
+    try:
+        shaped = len(value) == n_rows and all(len(r) == n_cols for r in value)
+    except TypeError:
+        shaped = False
+
+    if not shaped:
+        raise ValueError(
+            f"argument '{name}' must be a 2-D array of the selected shape "
+            f"{n_rows}x{n_cols}"
         )
+    return value
 
-        kwargs = {}
 
-        fill = None
-        if type is None:
-            kwargs["fill_type"] = "none"
-        elif isinstance(type, str):
-            kwargs["fill_type"] = type
+def _cell_style_array(sheet, i, j):
+    """Return the style array of the cell at (i, j), creating both if missing."""
+    cell = sheet._cells.get((i, j))
+    if cell is None:
+        cell = sheet.cell(i, j)
+
+    style = cell._style
+    if style is None:
+        style = cell._style = StyleArray()
+    return style
+
+
+def _cell_style_owner(sheet, i, j):
+    """Return the cell at (i, j), creating it if missing."""
+    cell = sheet._cells.get((i, j))
+    return sheet.cell(i, j) if cell is None else cell
+
+
+_COLUMN_ATTRS = ["width", "bestFit", "hidden", "outlineLevel", "collapsed"]
+
+
+def _column_span(key, dim):
+    lo = dim.min or column_index_from_string(key)
+    return lo, dim.max or lo
+
+
+def _split_column_groups(sheet, idxs):
+    """Give each column of ``idxs`` its own dimension again.
+
+    A dimension spanning min:max that covers any of the columns is replaced
+    by one dimension per column with the same attributes. Return the letters
+    of the dimensions created.
+    """
+    dims = sheet.column_dimensions
+    created = []
+    for key, dim in list(dims.items()):
+        lo, hi = _column_span(key, dim)
+        if lo == hi or not any(lo <= b and a <= hi for a, b in idxs.intervals):
+            continue
+
+        del dims[key]
+        attrs = {name: getattr(dim, name) for name in _COLUMN_ATTRS}
+        for k in range(lo, hi + 1):
+            letter = get_column_letter(k)
+            part = ColumnDimension(sheet, index=letter, min=k, max=k, **attrs)
+            if dim._style is not None:
+                part._style = StyleArray(dim._style)
+            dims[letter] = part
+            created.append(letter)
+    return created
+
+
+def _coalesce_columns(sheet, keys):
+    """Merge runs of adjacent, equal column dimensions into one min:max span.
+
+    Only the dimensions of ``keys`` are merged, the others are left as they
+    are. A sheet 200 columns wide of the same width then writes one ``<col>``.
+    """
+    dims = sheet.column_dimensions
+    spans = sorted((*_column_span(key, dims[key]), key) for key in set(keys))
+    run, run_attrs = None, None
+    for lo, hi, key in spans:
+        dim = dims[key]
+        style = dim._style
+        attrs = [getattr(dim, name) for name in _COLUMN_ATTRS]
+        attrs.append(None if style is None or not any(style) else style.tobytes())
+        if run is not None and run.max + 1 == lo and attrs == run_attrs:
+            run.max = hi
+            del dims[key]
+            continue
+
+        dim.min, dim.max = lo, hi
+        run, run_attrs = dim, attrs
+
+
+def _set_column_widths(sheet, widths, group=False):
+    """Set the width of each column index of ``widths``.
+
+    Spans covering the columns are split first, and what is left of them is
+    merged again. With ``group``, runs of the columns set are merged too.
+    """
+    created = _split_column_groups(sheet, _parse_index_list(list(widths)))
+    dims = sheet.column_dimensions
+    letters = []
+    for k, w in widths.items():
+        letter = get_column_letter(k)
+        dims[letter].width = w
+        letters.append(letter)
+
+    if group:
+        _coalesce_columns(sheet, created + letters)
+    else:
+        _coalesce_columns(sheet, set(created).difference(letters))
+
+
+def _spread_rows(rows, n):
+    """Yield n of the rows, evenly spread, without walking the others."""
+    step = len(rows) / n
+    k, offset = 0, 0  # the k-th pick and the position of the interval's start
+    for start, stop in rows.intervals:
+        size = stop - start + 1
+        while k < n and int(k * step) < offset + size:
+            yield start + int(k * step) - offset
+            k += 1
+        offset += size
+
+
+def _clamp(value, low, high):
+    return low if value < low else high if value > high else value
+
+
+def _text_width(text):
+    """The display width of a text, East Asian wide characters count two."""
+    if "\n" in text:
+        return max(_text_width(line) for line in text.split("\n"))
+    if text.isascii():
+        return len(text)
+    return sum(2 if east_asian_width(ch) in "WF" else 1 for ch in text)
+
+
+def _format_section(fmt):
+    """The first section of a number format without its colors, quotes etc."""
+    section = fmt.split(";")[0]
+    return re.sub(r"\[[^\]]*\]|[_*\\].|\"", "", section)
+
+
+def _number_width(value, fmt):
+    if fmt == "General":
+        if isinstance(value, float):
+            return min(len(f"{value:.10G}"), 11)
+        return len(str(value))
+
+    section = _format_section(fmt)
+    if "%" in section:
+        value = value * 100
+
+    decimals = 0
+    if "." in section:
+        fraction = section.split(".", 1)[1]
+        decimals = len(fraction) - len(fraction.lstrip("0#?"))
+
+    grouping = "," if "," in section else ""
+    text = f"{value:{grouping}.{decimals}f}"
+    literals = len(re.sub(r"[0#?,.]", "", section))
+    return len(text) + literals
+
+
+def _width_measure(wb, font_id, fmt_id):
+    """Return a function of a cell value to its width under the given style."""
+    font = wb._fonts[font_id]
+    scale = (font.sz or 11) / 11 * (1.1 if font.b else 1)
+
+    if fmt_id < BUILTIN_FORMATS_MAX_SIZE:
+        fmt = BUILTIN_FORMATS.get(fmt_id, "General")
+    else:
+        fmt = wb._number_formats[fmt_id - BUILTIN_FORMATS_MAX_SIZE]
+    date_width = len(_format_section(fmt)) if is_date_format(fmt) else None
+
+    def measure(value):
+        if isinstance(value, str):
+            if value.startswith("="):
+                return 0
+            return _text_width(value) * scale
+        if isinstance(value, bool):
+            return 5 * scale
+        if isinstance(value, (int, float)):
+            return _number_width(value, fmt) * scale
+        if date_width is not None:
+            return date_width * scale
+        return _text_width(str(value)) * scale
+
+    return measure
+
+
+_MAX_ROW = 1048576
+_MAX_COLUMN = 16384
+
+
+def _check_bounds(min_row, max_row, min_col, max_col):
+    """Raise if a range of cells doesn't fit in a worksheet."""
+    if min_row < 1 or min_col < 1:
+        raise ValueError("Row or column values must be at least 1")
+    if max_row > _MAX_ROW:
+        raise ValueError(
+            f"Row numbers must be between 1 and {_MAX_ROW}."
+            f" Row number supplied was {max_row}"
+        )
+    if max_col > _MAX_COLUMN:
+        raise ValueError(
+            f"Column numbers must be between 1 and {_MAX_COLUMN}."
+            f" Column number supplied was {max_col}"
+        )
+
+
+def _stamp_cell(sheet, i, j, ids):
+    """Set the (slot, id) pairs on the style array of the cell at (i, j).
+
+    Return whether any of them changed.
+    """
+    style = _cell_style_array(sheet, i, j)
+    changed = False
+    for slot, idx in ids:
+        if style[slot] != idx:
+            style[slot] = idx
+            changed = True
+    return changed
+
+
+def _parse_side_opts(
+    sides=None,
+    t=None,
+    l=None,  # noqa: E741
+    b=None,
+    r=None,
+    h=None,
+    v=None,
+    u=None,
+    d=None,
+    ls="thin",
+    c=None,
+):
+    side_opts = {}
+    if sides is not None:
+        if not isinstance(sides, str):
+            raise ValueError(
+                "Argument 'sides' has invalid side flags. "
+                "The flag must be one of 't', 'r', 'b', "
+                "'l', 'h', 'v', 'u', and 'd'."
+            )
+
+        sides = sides.lower()
+        if sides == "all":
+            sides = "trblhv"
+        elif sides == "outside":
+            sides = "trbl"
+        elif sides == "inside":
+            sides = "hv"
+
+        _unknowns = []
+        for flag in sides:
+            if flag in _side_flag_map:
+                side_opts[_side_flag_map[flag]] = True
+            else:
+                _unknowns.append(flag)
+        if _unknowns:
+            _flags = ", ".join([f"'{c}'" for c in _unknowns])
+            raise ValueError(
+                f"unknown side flag: {_flags}"
+                "The flag must be one of 't', 'r', 'b', "
+                "'l', 'h', 'v', 'u', and 'd'."
+            )
+
+    for value, attr_name in [
+        (t, "top"),
+        (r, "right"),
+        (b, "bottom"),
+        (l, "left"),
+        (h, "horizontal"),
+        (v, "vertical"),
+    ]:
+        _parse_border_side_option(side_opts, value, attr_name)
+
+    if u is not None:
+        if isinstance(u, bool):
+            side_opts["diagonalUp"] = u
         else:
-            raise ValueError("argument `type` must be a str or None")
+            raise ValueError(
+                "The diagnoal-up side argument 'u' must be a True or False"
+            )
 
-        if color is not None and isinstance(color, str):
-            kwargs["start_color"] = to_hex_color(color)
+    if d is not None:
+        if isinstance(d, bool):
+            side_opts["diagonalDown"] = d
+        else:
+            raise ValueError(
+                "The diagnoal-down side argument 'd' must be a True or False"
+            )
+
+    _normalize_side_opts(side_opts, ls=ls, c=c)
+
+    return side_opts
+
+
+def _parse_format_styles(
+    ha=None,
+    va=None,
+    wrap_text=None,
+    indent=None,
+    text_rotation=None,
+    shrink_to_fit=None,
+    number_format=None,
+    family=None,
+    size=None,
+    color=None,
+    background_color=None,
+    bold=None,
+    italic=None,
+    strike=None,
+    baseline=None,
+    superscript=None,
+    subscript=None,
+    underline=None,
+):
+    if ha and ha not in horizontal_alignments:
+        values = ", ".join([f"'{v}'" for v in horizontal_alignments])
+        raise ValueError(f"should be one of these values: {values}")
 
-        if background_color is not None and isinstance(background_color, str):
-            kwargs["end_color"] = to_hex_color(background_color)
+    if va and va not in vertical_aligments:
+        values = ", ".join([f"'{v}'" for v in vertical_aligments])
+        raise ValueError(f"should be one of these values: {values}")
 
-        fill = PatternFill(**kwargs)
+    font_kwargs = {}
+    if family is not None and isinstance(family, str):
+        font_kwargs["name"] = family
 
-        for i in row:
-            for j in col:
-                cell = sheet.cell(i, j)
-                cell.fill = fill
+    if size is not None and isinstance(size, (float, int)):
+        font_kwargs["size"] = size
+
+    if color is not None and isinstance(color, str):
+        font_kwargs["color"] = to_hex_color(color)
+
+    if bold is not None and isinstance(bold, bool):
+        font_kwargs["bold"] = bold
+
+    if italic is not None and isinstance(italic, bool):
+        font_kwargs["italic"] = italic
+
+    if strike is not None and isinstance(strike, bool):
+        font_kwargs["strike"] = strike
+
+    if baseline is not None and isinstance(baseline, bool):
+        font_kwargs["vertAlign"] = "baseline"
+
+    if superscript is not None and isinstance(superscript, bool):
+        font_kwargs["vertAlign"] = "superscript"
+
+    if subscript is not None and isinstance(subscript, bool):
+        font_kwargs["vertAlign"] = "subscript"
+
+    if underline is not None:
+        if isinstance(underline, bool):
+            underline = "single"
+        elif isinstance(underline, str):
+            if underline not in _UNDERLINE_OPTIONS:
+                _opts = ", ".join(f"'{c}'" for c in _UNDERLINE_OPTIONS)
+                raise ValueError(
+                    "argument 'underline' must be a bool True/False or "
+                    f"one of these values: {_opts}"
+                )
+        font_kwargs["underline"] = underline
+
+    styles = {}
+    if number_format is not None:
+        styles["number_format"] = number_format
+
+    if font_kwargs:
+        styles["font"] = _StyleDelta(**font_kwargs)
+
+    if background_color is not None and isinstance(background_color, str):
+        styles["fill"] = _StyleDelta(
+            fill_type="solid", start_color=to_hex_color(background_color)
+        )
+
+    alignment_kwargs = dict(
+        horizontal=ha,
+        vertical=va,
+        wrap_text=wrap_text,
+        indent=indent,
+        shrink_to_fit=shrink_to_fit,
+        text_rotation=text_rotation,
+    )
+    alignment_kwargs = {k: v for k, v in alignment_kwargs.items() if v is not None}
+    if alignment_kwargs:
+        styles["alignment"] = _StyleDelta(**alignment_kwargs)
+
+    return styles
+
+
+def _parse_fill_kwargs(type=None, color=None, background_color=None):
+    kwargs = {}
+    if type is None:
+        kwargs["fill_type"] = "none"
+    elif isinstance(type, str):
+        kwargs["fill_type"] = type
+    else:
+        raise ValueError("argument `type` must be a str or None")
+
+    if color is not None and isinstance(color, str):
+        kwargs["start_color"] = to_hex_color(color)
+
+    if background_color is not None and isinstance(background_color, str):
+        kwargs["end_color"] = to_hex_color(background_color)
+
+    return kwargs
+
+
+def _parse_fill(type=None, color=None, background_color=None):
+    kwargs = _parse_fill_kwargs(
+        type=type, color=color, background_color=background_color
+    )
+    return intern_fill(**kwargs)
+
+
+def _parse_fill_styles(type=None, color=None, background_color=None):
+    fill = _parse_fill(type=type, color=color, background_color=background_color)
+    return {"fill": fill}
+
+
+def _update_positional_sides(kwargs, side_opts, top, bottom, left, right):
+    """Set the border sides of a cell by its position in the bordered range."""
+    middle_sides = set(_OUTSIDES)
+    if top:
+        _update_kwargs(kwargs, side_opts, "top")
+        middle_sides.remove("top")
+
+    if bottom:
+        _update_kwargs(kwargs, side_opts, "bottom")
+        middle_sides.remove("bottom")
+
+    if left:
+        _update_kwargs(kwargs, side_opts, "left")
+        middle_sides.remove("left")
+
+    if right:
+        _update_kwargs(kwargs, side_opts, "right")
+        middle_sides.remove("right")
+
+    for side in middle_sides:
+        if side in ["top", "bottom"]:
+            if "horizontal" in side_opts:
+                kwargs[side] = side_opts["horizontal"]
+        elif side in ["right", "left"]:
+            if "vertical" in side_opts:
+                kwargs[side] = side_opts["vertical"]
+
+    for attr_name in _DIAGONALS:
+        _update_kwargs(kwargs, side_opts, attr_name)
+
+
+class _BorderVariants:
+    """The border sides of the nine cell positions of a bordered range.
+
+    A position is (top, bottom, left, right): whether the cell lies on that
+    edge of the range. The side changes of each position are computed once
+    and the merge with an existing border is left to the caller to memoize.
+    """
+
+    __slots__ = ("side_opts", "_deltas")
+
+    def __init__(self, side_opts):
+        self.side_opts = side_opts
+        self._deltas = {}
+
+    def delta(self, pos):
+        delta = self._deltas.get(pos)
+        if delta is None:
+            delta = {}
+            top, bottom, left, right = pos
+            _update_positional_sides(delta, self.side_opts, top, bottom, left, right)
+            self._deltas[pos] = delta
+        return delta
+
+    def merge(self, border, pos):
+        kwargs = _get_border_args(border)
+        kwargs.update(self.delta(pos))
+        return intern_border(**kwargs)
+
+
+_CELL_IS_OPERATORS = {
+    ">": "greaterThan",
+    ">=": "greaterThanOrEqual",
+    "<": "lessThan",
+    "<=": "lessThanOrEqual",
+    "==": "equal",
+    "=": "equal",
+    "!=": "notEqual",
+}
+
+
+def _formula_value(value):
+    if isinstance(value, str):
+        if value.startswith("="):
+            return value[1:]
+        return '"' + value.replace('"', '""') + '"'
+
+    if isinstance(value, bool):
+        return "TRUE" if value else "FALSE"
+
+    if isinstance(value, (int, float)):
+        return repr(value)
+
+    raise ValueError(f"unsupported conditional value: {value!r}")
+
+
+def _conditional_rule(op=None, value=None, color_scale=None, data_bar=None, **opts):
+    kinds = [op is not None, color_scale is not None, data_bar is not None]
+    if sum(kinds) != 1:
+        raise ValueError(
+            "exactly one of the arguments 'op', 'color_scale' and 'data_bar' "
+            "must be given"
+        )
+
+    if op is not None:
+        return _cell_is_rule(op, value, **opts)
+
+    if color_scale is not None:
+        return _color_scale_rule(color_scale)
+
+    return DataBarRule(start_type="min", end_type="max", color=to_hex_color(data_bar))
+
+
+def _cell_is_rule(
+    op, value, background_color=None, sides=None, ls="thin", c=None, **font_opts
+):
+    operator = _CELL_IS_OPERATORS.get(op, op)
+    if operator not in _CELL_IS_OPERATORS.values() and operator not in _BETWEENS:
+        ops = list(_CELL_IS_OPERATORS) + list(_CELL_IS_OPERATORS.values())
+        ops = ", ".join(f"'{o}'" for o in dict.fromkeys(ops + _BETWEENS))
+        raise ValueError(f"argument 'op' must be one of these values: {ops}")
+
+    if operator in _BETWEENS:
+        if not (isinstance(value, (list, tuple)) and len(value) == 2):
+            raise ValueError(f"'{op}' needs a pair of values, e.g. value=(0, 10)")
+        formula = [_formula_value(v) for v in value]
+    else:
+        formula = [_formula_value(value)]
+
+    font = _parse_format_styles(**font_opts).get("font")
+    if font is not None:
+        font = intern_font(**font.changes)
+
+    fill = None
+    if background_color is not None:
+        background_color = to_hex_color(background_color)
+        fill = intern_fill(
+            fill_type="solid", start_color=background_color, end_color=background_color
+        )
+
+    border = None
+    if sides is not None or c is not None:
+        side_opts = _parse_side_opts(sides=sides or "outside", ls=ls, c=c)
+        kwargs = {}
+        for attr_name in _OUTSIDES:
+            inside = "horizontal" if attr_name in ("top", "bottom") else "vertical"
+            side = side_opts.get(attr_name, side_opts.get(inside))
+            if side is not None:
+                kwargs[attr_name] = side
+        border = intern_border(**kwargs)
+
+    return CellIsRule(
+        operator=operator, formula=formula, font=font, fill=fill, border=border
+    )
+
+
+def _color_scale_rule(colors):
+    if not (isinstance(colors, (list, tuple)) and len(colors) in (2, 3)):
+        raise ValueError("argument 'color_scale' must be a list of 2 or 3 colors")
+
+    colors = [to_hex_color(c) for c in colors]
+    if len(colors) == 2:
+        return ColorScaleRule(
+            start_type="min",
+            start_color=colors[0],
+            end_type="max",
+            end_color=colors[1],
+        )
+
+    return ColorScaleRule(
+        start_type="min",
+        start_color=colors[0],
+        mid_type="percentile",
+        mid_value=50,
+        mid_color=colors[1],
+        end_type="max",
+        end_color=colors[2],
+    )
 
 
 _UNDERLINE_OPTIONS = ["single", "double", "singleAccounting", "doubleAccounting"]
@@ -402,6 +1884,8 @@ def _parse_border_side_option(side_opts, value, attr_name):
 
 _OUTSIDES = ["top", "right", "bottom", "left"]
 _INSIDES = ["horizontal", "vertical"]
+_BETWEENS = ["between", "notBetween"]
+_DIAGONALS = ["diagonal", "diagonalUp", "diagonalDown"]
 
 _side_flag_map = {
     "t": "top",
@@ -420,15 +1904,15 @@ def _normalize_side_opts(side_opts, ls=None, c=None):
         c = to_hex_color(c)
 
     if ls is None and c is None:
-        side = Side(style="thin")
+        side = intern_side(style="thin")
     elif ls is not None:
         if not (isinstance(ls, str) and ls in _LINE_STYLES):
             _flags = ", ".join([f"'{s}'" for s in _LINE_STYLES])
             raise ValueError(f"Invalid argument: 'ls' must be one of {_flags}.")
 
-        side = Side(style=ls, color=c)
+        side = intern_side(style=ls, color=c)
     else:
-        side = Side(style="thin", color=c)  # 指定边线颜色但未指定边线样式，默认thin
+        side = intern_side(style="thin", color=c)  # 指定边线颜色但未指定边线样式，默认thin
 
     sides = set(["top", "right", "bottom", "left", "horizontal", "vertical"])
     for attr_name, value in side_opts.items():
@@ -436,7 +1920,7 @@ def _normalize_side_opts(side_opts, ls=None, c=None):
             if isinstance(value, bool):
                 side_opts[attr_name] = side
             elif isinstance(value, str):
-                side_opts[attr_name] = Side(style=value, color=c)
+                side_opts[attr_name] = intern_side(style=value, color=c)
 
     if any(side_opts.get(s, False) for s in ["diagonalUp", "diagonalDown"]):
         side_opts["diagonal"] = side
@@ -463,13 +1947,96 @@ def _get_border_args(border):
     return args
 
 
+class _IndexSet:
+    """A sorted set of row or column indexes stored as inclusive intervals.
+
+    Iteration is lazy and membership is a bisection over the intervals, so a
+    selection of a million rows costs a couple of integers, not a list.
+    """
+
+    __slots__ = ("_starts", "_stops", "_size")
+
+    def __init__(self, intervals=()):
+        starts, stops = [], []
+        for start, stop in sorted(intervals):
+            if start > stop:
+                continue
+            if stops and start <= stops[-1] + 1:
+                if stop > stops[-1]:
+                    stops[-1] = stop
+            else:
+                starts.append(start)
+                stops.append(stop)
+
+        self._starts = starts
+        self._stops = stops
+        self._size = sum(b - a + 1 for a, b in zip(starts, stops))
+
+    @classmethod
+    def span(cls, start, stop):
+        return cls([(start, stop)])
+
+    @property
+    def intervals(self):
+        return list(zip(self._starts, self._stops))
+
+    @property
+    def first(self):
+        return self._starts[0]
+
+    @property
+    def last(self):
+        return self._stops[-1]
+
+    def __len__(self):
+        return self._size
+
+    def __bool__(self):
+        return self._size > 0
+
+    def __iter__(self):
+        for start, stop in zip(self._starts, self._stops):
+            yield from range(start, stop + 1)
+
+    def __contains__(self, idx):
+        k = bisect_right(self._starts, idx) - 1
+        return k >= 0 and idx <= self._stops[k]
+
+    def __eq__(self, other):
+        if isinstance(other, _IndexSet):
+            return self._starts == other._starts and self._stops == other._stops
+        return NotImplemented
+
+    def __repr__(self):
+        spans = ", ".join(f"{a}..{b}" if a != b else f"{a}" for a, b in self.intervals)
+        return f"_IndexSet({spans})"
+
+    def difference(self, other: "_IndexSet") -> "_IndexSet":
+        result, k = [], 0
+        skips = other.intervals
+        for start, stop in self.intervals:
+            while k < len(skips) and skips[k][1] < start:
+                k += 1
+            n = k
+            while start <= stop:
+                if n >= len(skips) or skips[n][0] > stop:
+                    result.append((start, stop))
+                    break
+                skip_start, skip_stop = skips[n]
+                if skip_start > start:
+                    result.append((start, skip_start - 1))
+                start = max(start, skip_stop + 1)
+                n += 1
+        return _IndexSet(result)
+
+
 def _parse_column_range(s: str):
     segs = s.split(":")
     n_segs = len(segs)
     if n_segs == 1:
         try:
             col_idx = column_index_from_string(s)
-            return [col_idx]
+            return col_idx, col_idx
         except ValueError:
             pass
         raise ValueError(s)
@@ -478,7 +2045,7 @@ def _parse_column_range(s: str):
         try:
             start = column_index_from_string(start)
             stop = column_index_from_string(stop)
-            return list(range(start, stop + 1))
+            return start, stop
         except ValueError:
             pass
         raise ValueError(s)
@@ -486,68 +2053,66 @@ def _parse_column_range(s: str):
         raise ValueError(s)
 
 
+def _range_intervals(r: range):
+    if not r:
+        return []
+    if r.step == 1:
+        return [(r.start, r.stop - 1)]
+    if r.step == -1:
+        return [(r.stop + 1, r.start)]
+    return [(i, i) for i in r]
+
+
 def _parse_index_list(idx):
     if isinstance(idx, int):
-        return [idx]
+        return _IndexSet.span(idx, idx)
     elif isinstance(idx, range):
-        return list(idx)
+        return _IndexSet(_range_intervals(idx))
 
-    _idxs = []
+    _intervals = []
     _invalids = []
 
     for c in idx:
         if isinstance(c, int):
-            _idxs.append(c)
+            _intervals.append((c, c))
         elif isinstance(c, range):
-            _idxs += list(c)
+            _intervals += _range_intervals(c)
         else:
             _invalids.append(c)
     if _invalids:
         msg = "， ".join([f"'{c}'" for c in _invalids])
         raise ValueError(msg)
 
-    return _keep_unqiue_sorted(_idxs)
-
-
-def _keep_unqiue_sorted(idxs):
-    uniques, prev = [], None
-    for i in sorted(idxs):
-        if prev != i:
-            prev = i
-            uniques.append(i)
-        else:
-            continue
-    return uniques
+    return _IndexSet(_intervals)
 
 
 def _parse_arg_rows(
     row=None, max_row=None, skip_rows=None, skip_header=None, skip_footer=None
 ):
-    if isinstance(row, (list, tuple)):
+    if isinstance(row, (list, tuple, range, int)):
         row = _parse_index_list(row)
-    elif isinstance(row, range):
-        row = list(row)
-    elif isinstance(row, int):
-        row = [row]
+    elif isinstance(row, _IndexSet):
+        pass
     elif row is None:
-        row = list(range(1, max_row + 1))
+        row = _IndexSet.span(1, max_row)
     else:
         raise ValueError(f"unknown rows='{repr(row)}'")
 
-    if len(row) == 0:
+    if not row:
         raise ValueError("no rows specified")
 
-    if skip_rows is None:
-        skip_rows = []
+    skips = []
+    if skip_rows is not None:
+        skips += _parse_index_list(skip_rows).intervals
 
     if skip_header is not None and isinstance(skip_header, int):
-        skip_rows += list(range(1, max_row + 1))[:skip_header]
+        skips.append((1, skip_header))
 
     if skip_footer is not None and isinstance(skip_footer, int):
-        skip_rows += list(range(1, max_row + 1))[(-skip_header):]
+        skips.append((max_row - skip_footer + 1, max_row))
 
-    if skip_rows:
-        row = [r for r in row if r not in skip_rows]
+    if skips:
+        row = row.difference(_IndexSet(skips))
 
     return row
 
@@ -555,15 +2120,21 @@ def _parse_arg_rows(
 def _parse_arg_cols(col=None, max_column=None):
     idxs = None
     if col is None:
-        idxs = list(range(1, max_column + 1))
+        idxs = _IndexSet.span(1, max_column)
+
+    elif isinstance(col, str):
+        try:
+            idxs = _IndexSet([_parse_column_range(col)])
+        except ValueError:
+            raise ValueError(f"invalid column names: '{col}'") from None
 
     elif isinstance(col, (list, tuple)):
         if all(isinstance(c, str) for c in col):
-            idxs = []
+            intervals = []
             _invalids = []
             for c in col:
                 try:
-                    idxs += _parse_column_range(c)
+                    intervals.append(_parse_column_range(c))
                 except ValueError as ex:
                     _invalids.append(c)
             if _invalids:
@@ -571,14 +2142,14 @@ def _parse_arg_cols(col=None, max_column=None):
                 msg = f"invalid column names: {msg}"
                 raise ValueError(msg)
 
-            idxs = _keep_unqiue_sorted(idxs)
+            idxs = _IndexSet(intervals)
         else:
             idxs = _parse_index_list(col)
 
-    elif isinstance(col, range):
-        idxs = list(col)
-    elif isinstance(col, int):
-        idxs = [col]
+    elif isinstance(col, (range, int)):
+        idxs = _parse_index_list(col)
+    elif isinstance(col, _IndexSet):
+        idxs = col
     else:
         raise ValueError(f"unknown argument: cols={repr(col)}")
 
@@ -588,5 +2159,32 @@ def _parse_arg_cols(col=None, max_column=None):
     return idxs
 
 
-def xlstyle(sheet):
-    return ExcelSheetStyler(sheet)
+def xlstyle(
+    sheet,
+    profile: bool = False,
+    on_op=None,
+    dimension_styles: bool = False,
+    ignore_style_only: bool = False,
+):
+    if type(sheet).__module__.startswith("xlsxwriter."):
+        from .xlwriter import XlsxWriterStyler
+
+        options = dict(
+            profile=profile,
+            on_op=on_op,
+            dimension_styles=dimension_styles,
+            ignore_style_only=ignore_style_only,
+        )
+        unsupported = ", ".join(k for k, v in options.items() if v)
+        if unsupported:
+            msg = f"arguments not supported for an xlsxwriter sheet: {unsupported}"
+            raise ValueError(msg)
+        return XlsxWriterStyler(sheet)
+
+    return ExcelSheetStyler(
+        sheet,
+        profile=profile,
+        on_op=on_op,
+        dimension_styles=dimension_styles,
+        ignore_style_only=ignore_style_only,
+    )
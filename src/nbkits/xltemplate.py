@@ -0,0 +1,194 @@
+import json
+from copy import copy
+
+from .xlstyler import (
+    _BorderVariants,
+    _conditional_rule,
+    _is_varying,
+    _parse_arg_cols,
+    _parse_arg_rows,
+    _parse_fill_styles,
+    _parse_format_styles,
+    _parse_side_opts,
+    xlstyle,
+)
+
+
+class StyleTemplate:
+    """A styling chain recorded once and replayed onto many worksheets.
+
+    The methods take the arguments of ``ExcelSheetStyler``'s and are checked,
+    with their colors resolved and style objects built, when recorded::
+
+        report = xltemplate().format(row=1, bold=True).border(sides="outside")
+        for ws in wb.worksheets:
+            report.apply(ws)
+
+    Omitted rows and columns and the skip arguments are resolved against each
+    sheet on ``apply``. A template pickles as compiled, ``to_json`` saves the
+    recorded calls, which are compiled again by ``from_json``.
+    """
+
+    def __init__(self):
+        self._calls = []
+        self._steps = []
+
+    def column_width(self, width, col=None, group=False):
+        kwargs = dict(width=width, col=col, group=group)
+        self._record("column_width", kwargs)
+        return self._add("column_width", None, None, {}, kwargs)
+
+    def row_height(
+        self,
+        height,
+        row=None,
+        skip_rows=None,
+        skip_header=None,
+        skip_footer=None,
+        default=False,
+    ):
+        kwargs = dict(
+            height=height,
+            row=row,
+            skip_rows=skip_rows,
+            skip_header=skip_header,
+            skip_footer=skip_footer,
+            default=default,
+        )
+        self._record("row_height", kwargs)
+        return self._add("row_height", None, None, {}, kwargs)
+
+    def format(
+        self,
+        col=None,
+        row=None,
+        skip_rows=None,
+        skip_header=None,
+        skip_footer=None,
+        **kwargs,
+    ):
+        return self._add_styles(
+            "format",
+            _parse_format_styles,
+            col,
+            row,
+            dict(skip_rows=skip_rows, skip_header=skip_header, skip_footer=skip_footer),
+            kwargs,
+        )
+
+    def patten_fill(
+        self,
+        col=None,
+        row=None,
+        skip_rows=None,
+        skip_header=None,
+        skip_footer=None,
+        groups=None,
+        **kwargs,
+    ):
+        skips = dict(skip_rows=skip_rows, skip_header=skip_header, skip_footer=skip_footer)
+        if groups is not None:  # the banded rows are selected on apply
+            skips["groups"] = groups
+        return self._add_styles(
+            "patten_fill", _parse_fill_styles, col, row, skips, kwargs
+        )
+
+    def border(
+        self,
+        col=None,
+        row=None,
+        skip_rows=None,
+        skip_header=None,
+        skip_footer=None,
+        groups=None,
+        **kwargs,
+    ):
+        skips = dict(skip_rows=skip_rows, skip_header=skip_header, skip_footer=skip_footer)
+        variants = _BorderVariants(_parse_side_opts(**kwargs))
+        self._record("border", dict(col=col, row=row, **skips, groups=groups, **kwargs))
+        return self._add("border", col, row, dict(skips, groups=groups), variants)
+
+    def conditional(
+        self,
+        col=None,
+        row=None,
+        skip_rows=None,
+        skip_header=None,
+        skip_footer=None,
+        **kwargs,
+    ):
+        skips = dict(skip_rows=skip_rows, skip_header=skip_header, skip_footer=skip_footer)
+        rule = _conditional_rule(**kwargs)
+        self._record("conditional", dict(col=col, row=row, **skips, **kwargs))
+        return self._add("conditional", col, row, skips, rule)
+
+    def apply(self, sheet, **styler_opts):
+        """Replay the template onto a worksheet, return the styler used."""
+        styler = xlstyle(sheet, **styler_opts)
+        for kind, col, row, skips, payload in self._steps:
+            if kind in ("styles", "varying") and "groups" in skips:
+                skips = dict(skips)
+                row = styler._banded_rows(row, skips.pop("groups"), **skips)
+                skips = dict.fromkeys(skips)
+
+            if kind == "styles":
+                styler._set_selection_styles(col, row, payload, **skips)
+            elif kind == "varying":
+                parse, opts, varying = payload
+                styler._set_varying_styles(col, row, parse, opts, varying, **skips)
+            elif kind == "border":
+                styler._set_border(col, row, payload, **skips)
+            elif kind == "conditional":
+                styler._add_conditional(col, row, copy(payload), **skips)
+            else:
+                getattr(styler, kind)(**payload)
+        return styler
+
+    def to_json(self) -> str:
+        """Return the recorded calls as JSON; per-cell callables can't be saved."""
+        return json.dumps({"calls": self._calls}, default=_encode_json)
+
+    @classmethod
+    def from_json(cls, text: str) -> "StyleTemplate":
+        template = cls()
+        for method, kwargs in json.loads(text, object_hook=_decode_json)["calls"]:
+            getattr(template, method)(**kwargs)
+        return template
+
+    def _add_styles(self, method, parse, col, row, skips, kwargs):
+        varying = {k: v for k, v in kwargs.items() if _is_varying(v)}
+        if varying:
+            payload = ("varying", (parse, kwargs, varying))
+        else:
+            payload = ("styles", parse(**kwargs))
+
+        self._record(method, dict(col=col, row=row, **skips, **kwargs))
+        return self._add(payload[0], col, row, skips, payload[1])
+
+    def _add(self, kind, col, row, skips, payload):
+        if col is not None:
+            col = _parse_arg_cols(col)
+        if row is not None:
+            row = _parse_arg_rows(row)
+        self._steps.append((kind, col, row, skips, payload))
+        return self
+
+    def _record(self, method, kwargs):
+        kwargs = {k: v for k, v in kwargs.items() if v is not None}
+        self._calls.append((method, kwargs))
+
+
+def _encode_json(value):
+    if isinstance(value, range):
+        return {"range": [value.start, value.stop, value.step]}
+    raise TypeError(f"{value!r} can't be saved to JSON")
+
+
+def _decode_json(obj):
+    if list(obj) == ["range"]:
+        return range(*obj["range"])
+    return obj
+
+
+def xltemplate() -> StyleTemplate:
+    return StyleTemplate()
@@ -0,0 +1,381 @@
+from itertools import repeat
+
+from .xlstyler import (
+    _StyleDelta,
+    _check_default_height,
+    _check_scalar,
+    _parse_arg_cols,
+    _parse_arg_rows,
+    _parse_fill_kwargs,
+    _parse_format_styles,
+    _parse_side_opts,
+    _update_positional_sides,
+)
+
+_PATTERNS = {
+    "none": 0,
+    "solid": 1,
+    "mediumGray": 2,
+    "darkGray": 3,
+    "lightGray": 4,
+    "darkHorizontal": 5,
+    "darkVertical": 6,
+    "darkDown": 7,
+    "darkUp": 8,
+    "darkGrid": 9,
+    "darkTrellis": 10,
+    "lightHorizontal": 11,
+    "lightVertical": 12,
+    "lightDown": 13,
+    "lightUp": 14,
+    "lightGrid": 15,
+    "lightTrellis": 16,
+    "gray125": 17,
+    "gray0625": 18,
+}
+
+_BORDER_STYLES = {
+    "thin": 1,
+    "medium": 2,
+    "dashed": 3,
+    "dotted": 4,
+    "thick": 5,
+    "double": 6,
+    "hair": 7,
+    "mediumDashed": 8,
+    "dashDot": 9,
+    "mediumDashDot": 10,
+    "dashDotDot": 11,
+    "mediumDashDotDot": 12,
+    "slantDashDot": 13,
+}
+
+_BORDER_KEYS = {"diagonal": ("diag_border", "diag_color")}
+
+_UNDERLINES = {"single": 1, "double": 2, "singleAccounting": 33, "doubleAccounting": 34}
+
+_SCRIPTS = {"superscript": 1, "subscript": 2}
+
+_HORIZONTALS = {"centerContinuous": "center_across"}
+
+_INDENTED_HORIZONTALS = {"left", "right", "distributed"}
+
+_VERTICALS = {"center": "vcenter", "justify": "vjustify", "distributed": "vdistributed"}
+
+
+def _color(rgb):
+    return "#" + rgb[-6:]
+
+
+def _horizontal(value):
+    if value == "general":  # xlsxwriter's default, it has no "general" align
+        return {}
+    return {"align": _HORIZONTALS.get(value, value)}
+
+
+_PROPS = {
+    "font": {
+        "name": lambda v: {"font_name": v},
+        "size": lambda v: {"font_size": v},
+        "color": lambda v: {"font_color": _color(v)},
+        "bold": lambda v: {"bold": v},
+        "italic": lambda v: {"italic": v},
+        "strike": lambda v: {"font_strikeout": v},
+        "underline": lambda v: {"underline": _UNDERLINES[v]},
+        "vertAlign": lambda v: {"font_script": _SCRIPTS.get(v, 0)},
+    },
+    "fill": {
+        "fill_type": lambda v: {"pattern": _PATTERNS.get(v, 0)},
+        "start_color": lambda v: {"fg_color": _color(v)},
+        "end_color": lambda v: {"bg_color": _color(v)},
+    },
+    "alignment": {
+        "horizontal": _horizontal,
+        "vertical": lambda v: {"valign": _VERTICALS.get(v, v)},
+        "wrap_text": lambda v: {"text_wrap": v},
+        "indent": lambda v: {"indent": v},
+        "shrink_to_fit": lambda v: {"shrink": v},
+        "text_rotation": lambda v: {"rotation": v},
+    },
+}
+
+
+def _format_props(styles):
+    """Translate parsed ``format`` styles into xlsxwriter format properties."""
+    props = {}
+    for name, value in styles.items():
+        if name == "number_format":
+            props["num_format"] = value
+            continue
+
+        for attr, v in value.changes.items():
+            props.update(_PROPS[name][attr](v))
+    return props
+
+
+def _border_props(sides):
+    """Translate the Side objects of a cell's border into format properties."""
+    props = {}
+    for name in ["top", "bottom", "left", "right", "diagonal"]:
+        side = sides.get(name)
+        if side is None or side.style is None:
+            continue
+
+        key, color_key = _BORDER_KEYS.get(name, (name, f"{name}_color"))
+        props[key] = _BORDER_STYLES[side.style]
+        if side.color is not None and side.color.type == "rgb":
+            props[color_key] = _color(side.color.rgb)
+
+    if "diag_border" in props:
+        up, down = sides.get("diagonalUp"), sides.get("diagonalDown")
+        props["diag_type"] = (1 if up else 0) + (2 if down else 0) or 3
+    return props
+
+
+class XlsxWriterStyler:
+    """The ``xlstyle`` API for an xlsxwriter worksheet.
+
+    xlsxwriter formats cells as they are written, so the styles are declared
+    first and the data is then written through ``write_rows``, in row order
+    as the ``constant_memory`` mode requires::
+
+        ws = xlsxwriter.Workbook(path, {"constant_memory": True}).add_worksheet()
+        s = xlstyle(ws).format(row=1, bold=True).border(sides="outside")
+        s.write_rows(data)
+
+    Rows and columns are numbered from 1 as with openpyxl; omitted rows and
+    the skip arguments are resolved against the number of rows written. Each
+    distinct combination of styles becomes one cached ``Format``.
+    """
+
+    def __init__(self, sheet):
+        self._sheet = sheet
+        self._rules = []
+        self._heights = []
+        self._formats = {}
+
+    def column_width(
+        self,
+        width: float | int | list[float | int],
+        col: list[int] | list[str] | None = None,
+    ):
+        if col is None:
+            if not isinstance(width, (list, tuple)):
+                raise ValueError("argument 'col' is required for a single width")
+            col = range(1, 1 + len(width))
+
+        col = _parse_arg_cols(col=col)
+        if isinstance(width, (list, tuple)):
+            if len(width) != len(col):
+                msg = (
+                    "The lists, 'width' and 'cols' , must be of equal length:"
+                    f" {len(width)} != {len(col)}"
+                )
+                raise ValueError(msg)
+        else:
+            width = repeat(width, len(col))
+
+        run = None
+        for j, w in zip(col, width):
+            if run is not None and run[1] == j - 1 and run[2] == w:
+                run[1] = j
+                continue
+
+            if run is not None:
+                self._sheet.set_column(run[0] - 1, run[1] - 1, run[2])
+            run = [j, j, w]
+        if run is not None:
+            self._sheet.set_column(run[0] - 1, run[1] - 1, run[2])
+
+        return self
+
+    def row_height(
+        self,
+        height: float | int | list[float | int],
+        row: list[int] | list[str] = None,
+        skip_rows: list[int] = None,
+        skip_header: int | None = None,
+        skip_footer: int = None,
+        default: bool = False,
+    ):
+        if default:
+            _check_default_height(height, row, skip_rows, skip_header, skip_footer)
+            self._sheet.set_default_row(height)
+            return self
+
+        self._heights.append((row, _skips(skip_rows, skip_header, skip_footer), height))
+        return self
+
+    def format(
+        self,
+        col=None,
+        row=None,
+        skip_rows=None,
+        skip_header: int | None = None,
+        skip_footer=None,
+        **kwargs,
+    ):
+        """Accept the style arguments of ``ExcelSheetStyler.format``.
+
+        xlsxwriter indents only text aligned "left", "right" or "distributed",
+        an ``indent`` with another ``ha`` is rejected. Indented cells without
+        an ``ha`` are aligned left.
+        """
+        _check_scalar(kwargs, "xlsxwriter")
+        ha = kwargs.get("ha")
+        if kwargs.get("indent") and ha is not None and ha not in _INDENTED_HORIZONTALS:
+            raise ValueError(f"xlsxwriter cannot indent text aligned {ha!r}")
+        props = _format_props(_parse_format_styles(**kwargs))
+        skips = _skips(skip_rows, skip_header, skip_footer)
+        return self._add_rule("props", col, row, skips, props)
+
+    def patten_fill(
+        self,
+        col=None,
+        row=None,
+        type: str | None = None,
+        color: str | None = None,
+        background_color: str | None = None,
+        skip_rows=None,
+        skip_header: int | None = None,
+        skip_footer=None,
+        groups=None,
+    ):
+        _check_no_groups(groups)
+        kwargs = dict(type=type, color=color, background_color=background_color)
+        _check_scalar(kwargs, "xlsxwriter")
+        fill = _StyleDelta(**_parse_fill_kwargs(**kwargs))
+        props = _format_props({"fill": fill})
+        skips = _skips(skip_rows, skip_header, skip_footer)
+        return self._add_rule("props", col, row, skips, props)
+
+    def border(
+        self,
+        col=None,
+        row=None,
+        skip_rows=None,
+        skip_header: int | None = None,
+        skip_footer=None,
+        groups=None,
+        **kwargs,
+    ):
+        """Accept the side arguments of ``ExcelSheetStyler.border``."""
+        _check_no_groups(groups)
+        side_opts = _parse_side_opts(**kwargs)
+        skips = _skips(skip_rows, skip_header, skip_footer)
+        return self._add_rule("border", col, row, skips, side_opts)
+
+    def _add_rule(self, kind, col, row, skips, payload):
+        if col is not None:
+            col = _parse_arg_cols(col=col)
+        self._rules.append((kind, col, row, skips, payload))
+        return self
+
+    def write_rows(self, rows, nrows: int | None = None, ncols: int | None = None):
+        """Write the rows of values from row 1 with their cells styled.
+
+        ``nrows`` is needed when ``rows`` has no length and a style depends on
+        the last row; ``ncols`` defaults to the length of the first row.
+        """
+        if nrows is None and hasattr(rows, "__len__"):
+            nrows = len(rows)
+
+        rules = None
+        heights = {}
+        cache = {}
+        write = self._sheet.write
+        for i, values in enumerate(rows, 1):
+            values = list(values)
+            if rules is None:
+                ncols = ncols or len(values)
+                rules = self._resolve_rules(nrows, ncols)
+                heights = self._resolve_heights(nrows)
+
+            if i in heights:
+                self._sheet.set_row(i - 1, heights[i])
+
+            key = tuple(
+                (i in selected, i == selected.first, i == selected.last)
+                for _, _, selected, _ in rules
+            )
+            formats = cache.get(key)
+            if formats is None:
+                formats = cache[key] = {}
+
+            n = max(len(values), ncols)
+            for j in range(1, n + 1):
+                fmt = formats.get(j, False)
+                if fmt is False:
+                    fmt = formats[j] = self._cell_format(rules, key, j)
+
+                value = values[j - 1] if j <= len(values) else None
+                if value is None and fmt is None:
+                    continue
+                write(i - 1, j - 1, value, fmt)
+
+        return self
+
+    def _resolve_rules(self, nrows, ncols):
+        resolved = []
+        for kind, col, row, skips, payload in self._rules:
+            needs_nrows = row is None or skips["skip_footer"] is not None
+            if needs_nrows and nrows is None:
+                raise ValueError("argument 'nrows' is required for these styles")
+
+            rows = _parse_arg_rows(row=row, max_row=nrows, **skips)
+            if col is None:
+                col = _parse_arg_cols(max_column=ncols)
+            resolved.append((kind, col, rows, payload))
+        return resolved
+
+    def _resolve_heights(self, nrows):
+        heights = {}
+        for row, skips, height in self._heights:
+            rows = _parse_arg_rows(row=row, max_row=nrows, **skips)
+            if isinstance(height, (list, tuple)):
+                if len(height) != len(rows):
+                    msg = (
+                        "The lists, 'height' and 'rows' , must be of equal length:"
+                        f" {len(height)} != {len(rows)}"
+                    )
+                    raise ValueError(msg)
+            else:
+                height = repeat(height, len(rows))
+            heights.update(zip(rows, height))
+        return heights
+
+    def _cell_format(self, rules, key, j):
+        props, sides = {}, None
+        for (kind, col, _, payload), (in_rows, top, bottom) in zip(rules, key):
+            if not in_rows or j not in col:
+                continue
+
+            if kind == "props":
+                props.update(payload)
+                continue
+
+            if sides is None:
+                sides = {}
+            left, right = j == col.first, j == col.last
+            _update_positional_sides(sides, payload, top, bottom, left, right)
+
+        if sides:
+            props.update(_border_props(sides))
+
+        if not props:
+            return None
+
+        fmt_key = tuple(sorted(props.items()))
+        fmt = self._formats.get(fmt_key)
+        if fmt is None:
+            fmt = self._formats[fmt_key] = self._sheet.workbook_add_format(props)
+        return fmt
+
+
+def _skips(skip_rows, skip_header, skip_footer):
+    return dict(skip_rows=skip_rows, skip_header=skip_header, skip_footer=skip_footer)
+
+
+def _check_no_groups(groups):
+    if groups is not None:
+        raise ValueError("groups is not supported by xlsxwriter")
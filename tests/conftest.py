@@ -0,0 +1,17 @@
+import io
+import zipfile
+
+import pytest
+
+
+def _xml_parts(wb):
+    buf = io.BytesIO()
+    wb.save(buf)
+    with zipfile.ZipFile(buf) as zf:
+        return {n: zf.read(n) for n in zf.namelist() if n.startswith("xl/")}
+
+
+@pytest.fixture
+def xml_parts():
+    """Return the function saving a workbook to its XML parts, by name."""
+    return _xml_parts
@@ -0,0 +1,48 @@
+import datetime
+
+import openpyxl
+import pytest
+from nbkits import xlstyle
+from nbkits.xlstyler import _IndexSet, _spread_rows
+
+
+def test_autofit():
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.append(["name", "amount", "pct", "day", "中文名称很长", None])
+    for i in range(1, 101):
+        ws.append([f"item {i}", 1234.5 * i, i / 100, datetime.date(2024, 1, 1), "好"])
+    ws["A50"] = "a much longer name\nover two lines"
+
+    s = xlstyle(ws).format(row=1, bold=True)
+    s.format(col="B", number_format="#,##0.00").format(col="C", number_format="0%")
+    s.autofit(max=16)
+
+    widths = {k: d.width for k, d in ws.column_dimensions.items()}
+    assert widths["A"] == 16
+    assert widths["B"] == len("123,450.00") + 2
+    assert widths["C"] == len("100%") + 2
+    assert widths["D"] == len("yyyy-mm-dd") + 2
+    assert widths["E"] == pytest.approx(12 * 1.1 + 2)
+    assert "F" not in widths
+
+    s.autofit(col="A", skip_rows=[50])
+    assert ws.column_dimensions["A"].width == len("item 100") + 2
+    s.autofit(col="A:B", sample=10, min=12)
+    assert ws.column_dimensions["A"].width == 12
+
+
+def test_autofit_sample():
+    rows = _IndexSet([(1, 10), (21, 30)])
+    assert list(_spread_rows(rows, 4)) == [1, 6, 21, 26]
+    assert list(_spread_rows(rows, 3)) == [1, 7, 24]
+    assert list(_spread_rows(rows, 20)) == list(rows)
+
+    ws = openpyxl.Workbook().active
+    for i in range(1, 31):
+        ws.append(["x" * i])
+    xlstyle(ws).autofit(sample=3, skip_rows=range(11, 21), max=100)
+    assert ws.column_dimensions["A"].width == 24 + 2
+    for sample in [0, -1]:
+        with pytest.raises(ValueError):
+            xlstyle(ws).autofit(sample=sample)
@@ -0,0 +1,47 @@
+import openpyxl
+from nbkits.xlstyler import xlstyle
+
+
+def _style_chain(styler):
+    return (
+        styler.format(row=range(1, 4), col=range(1, 5), bold=True, ha="center")
+        .format(row=1, color="r", background_color="tab:blue")
+        .border(col=range(1, 5), row=range(1, 4), sides="outside", ls="thick")
+        .border(col=range(1, 5), row=range(1, 4), sides="inside", c="b")
+        .patten_fill(row=3, col=range(2, 4), type="solid", color="y")
+    )
+
+
+def _cell_styles(ws):
+    # both sheets share the workbook's style tables, so equal ids mean equal styles
+    return {(c.row, c.column): tuple(c._style) for row in ws.iter_rows() for c in row}
+
+
+def test_batch_equals_immediate():
+    wb = openpyxl.Workbook()
+    immediate = wb.active
+    deferred = wb.create_sheet()
+    for ws in (immediate, deferred):
+        for i in range(1, 4):
+            ws.append([i * 10 + j for j in range(1, 5)])
+
+    _style_chain(xlstyle(immediate))
+    with xlstyle(deferred).batch() as s:
+        _style_chain(s)
+        assert not deferred["A1"].font.b  # nothing applied before exit
+
+    assert _cell_styles(deferred) == _cell_styles(immediate)
+
+
+def test_batch_discarded_on_error():
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws["A1"] = 1
+    try:
+        with xlstyle(ws).batch() as s:
+            s.format(col=1, bold=True)
+            raise RuntimeError
+    except RuntimeError:
+        pass
+
+    assert not ws["A1"].font.b
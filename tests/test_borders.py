@@ -1,4 +1,5 @@
 import openpyxl
+import pytest
 from nbkits.xlstyler import xlstyle
 from pathlib import Path
 
@@ -51,5 +52,64 @@ def main():
     wb.save(test_dir / "test_borders.xlsx")
 
 
+def test_layered_borders():
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    (
+        xlstyle(ws)
+        .border(col=range(2, 6), row=range(2, 6), sides="inside", c="r")
+        .border(col=range(2, 6), row=range(2, 6), sides="outside", ls="thick")
+        .border(col=3, row=3, u=True, d=True)
+    )
+
+    assert ws["B2"].border.top.style == "thick"
+    assert ws["B2"].border.bottom.color.rgb == "00FF0000"
+    assert ws["C3"].border.left.style == "thin"
+    assert ws["E5"].border.right.style == "thick"
+    assert ws["C3"].border.diagonalUp and ws["C3"].border.diagonal.style == "thin"
+
+
+def test_grouped_borders_and_bands():
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.append(["key", "value"])
+    for key, n in [("a", 3), ("b", 1), ("c", 2)]:
+        for k in range(n):
+            ws.append([key, k])
+
+    (
+        xlstyle(ws)
+        .border(skip_header=1, groups="A", sides="outside", h="hair")
+        .patten_fill(skip_header=1, groups="A", type="solid", color="y")
+    )
+
+    def sides(coord):
+        border = ws[coord].border
+        return border.top.style, border.bottom.style
+
+    assert sides("A2") == ("thin", "hair")
+    assert sides("B3") == ("hair", "hair")
+    assert sides("A4") == ("hair", "thin")
+    assert sides("B5") == ("thin", "thin")
+    assert sides("A6") == ("thin", "hair") and sides("A7") == ("hair", "thin")
+    assert ws["A1"].border.bottom.style is None
+    filled = [i for i in range(1, 8) if ws.cell(i, 2).fill.fill_type == "solid"]
+    assert filled == [2, 3, 4, 6, 7]
+
+    ws2 = wb.create_sheet()
+    for i in range(6):
+        ws2.append([i, i])
+    xlstyle(ws2).patten_fill(groups=[1] * 6, type="solid", color="y")
+    assert [ws2.cell(i, 1).fill.fill_type for i in range(1, 7)] == ["solid", None] * 3
+    xlstyle(ws2).border(groups=[2, 4], sides="outside")
+    assert ws2["A2"].border.bottom.style and ws2["A3"].border.top.style
+
+    with pytest.raises(ValueError):
+        xlstyle(ws2).border(groups=[2, 3], sides="outside")
+    for key in [0, -1, "A:B"]:
+        with pytest.raises(ValueError):
+            xlstyle(ws2).border(groups=key, sides="outside")
+
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,58 @@
+import re
+import subprocess
+import sys
+
+import pytest
+from nbkits.utils import to_hex_color, to_hex_colors
+
+# generous bound so only a regression such as importing matplotlib trips it
+IMPORT_TIME_LIMIT_US = 50_000
+
+
+def test_named_colors():
+    assert to_hex_color("r") == "FF0000"
+    assert to_hex_color("c") == "00BFBF"
+    assert to_hex_color("tab:blue") == "1F77B4"
+    assert to_hex_color("xkcd:red") == "E50000"
+    assert to_hex_color("aliceblue") == "F0F8FF"
+    assert to_hex_color("E0E0E0") == "E0E0E0"
+
+
+def test_import_does_not_load_matplotlib():
+    code = (
+        "import sys, nbkits; "
+        "nbkits.xlstyle; nbkits.utils.to_hex_color('tab:red'); "
+        "print('matplotlib' in sys.modules, 'IPython' in sys.modules)"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert out.stdout.split() == ["False", "False"]
+
+
+def test_import_time():
+    out = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import nbkits.utils"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = re.findall(r"\|\s*(\d+) \|\s*nbkits\.utils$", out.stderr, re.M)
+    assert times, out.stderr
+    assert int(times[0]) < IMPORT_TIME_LIMIT_US
+
+
+def test_batch_colors():
+    specs = [["r", "tab:blue", None], ["r", "r", "E0E0E0"]]
+    assert to_hex_colors(specs) == [
+        ["FF0000", "1F77B4", None],
+        ["FF0000", "FF0000", "E0E0E0"],
+    ]
+
+
+def test_batch_colors_numpy():
+    np = pytest.importorskip("numpy")
+    specs = np.array([["r", "g"], ["b", "r"]])
+    result = to_hex_colors(specs)
+    assert result.shape == (2, 2)
+    assert result.tolist() == [["FF0000", "008000"], ["0000FF", "FF0000"]]
@@ -0,0 +1,55 @@
+import io
+from copy import copy
+
+import openpyxl
+import pytest
+from openpyxl.styles import NamedStyle, Font
+from nbkits import compact_styles, xlstyle
+
+
+def _cell_styles(wb):
+    ws = wb.active
+    return {
+        c.coordinate: (
+            *(copy(style) for style in [c.font, c.fill, c.border, c.alignment]),
+            c.number_format,
+        )
+        for row in ws.iter_rows()
+        for c in row
+    }
+
+
+def test_compact_styles():
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    for i in range(1, 31):
+        ws.append([i, i * 2, i * 3])
+    wb.add_named_style(NamedStyle("note", font=Font(italic=True, size=9)))
+    ws["D1"].style = "note"
+
+    s = xlstyle(ws, dimension_styles=True)
+    for k, color in enumerate(["r", "g", "b", "y", "c"]):
+        s.format(color=color, number_format=f"0.{'0' * (k + 1)}")
+        s.patten_fill(row=range(2, 31, 2), type="solid", color=color)
+        s.border(sides="outside", c=color)
+    s.format(col="C", size=14)
+
+    before = _cell_styles(wb)
+    buf = io.BytesIO()
+    wb.save(buf)
+
+    removed = compact_styles(wb)
+    assert removed["fonts"] >= 4 and removed["fills"] == 4
+    assert removed["number_formats"] == 3 and removed["cell_styles"] > 0
+    assert len(wb._fills) == 3
+    assert _cell_styles(wb) == before
+    assert ws.column_dimensions["C"].font.sz == 14
+    assert ws["D1"].style == "note"
+
+    assert compact_styles(wb) == dict.fromkeys(removed, 0)
+    buf = io.BytesIO()
+    wb.save(buf)
+    assert _cell_styles(openpyxl.load_workbook(buf)) == before
+
+    with pytest.raises(ValueError):
+        compact_styles(openpyxl.Workbook(write_only=True))
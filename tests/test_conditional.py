@@ -0,0 +1,57 @@
+import io
+
+import openpyxl
+import pytest
+from nbkits.xlstyler import xlstyle
+
+
+def test_conditional_rules():
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    for i in range(1, 101):
+        ws.append([f"r{i}", i - 50, i * 1.5, i])
+
+    (
+        xlstyle(ws)
+        .conditional(col="B", skip_header=1, op="<", value=0, color="r", bold=True)
+        .conditional(
+            col="B",
+            row=range(2, 101),
+            skip_rows=[50],
+            op="between",
+            value=(10, "=$D$1"),
+            background_color="tab:green",
+            sides="outside",
+            c="b",
+        )
+        .conditional(col="C", color_scale=["r", "y", "g"])
+        .conditional(col="D", data_bar="tab:blue")
+    )
+
+    rules = {str(cf.sqref): cf.rules for cf in ws.conditional_formatting}
+    assert set(rules) == {"B2:B100", "B2:B49 B51:B100", "C1:C100", "D1:D100"}
+
+    less = rules["B2:B100"][0]
+    assert (less.type, less.operator, less.formula) == ("cellIs", "lessThan", ["0"])
+    assert less.dxf.font.b and less.dxf.font.color.rgb == "00FF0000"
+
+    between = rules["B2:B49 B51:B100"][0]
+    assert between.formula == ["10", "$D$1"]
+    assert between.dxf.fill.bgColor.rgb == "002CA02C"
+    assert between.dxf.border.left.color.rgb == "000000FF"
+
+    assert len(rules["C1:C100"][0].colorScale.color) == 3
+    assert rules["D1:D100"][0].dataBar.color.rgb == "001F77B4"
+
+    wb.save(io.BytesIO())
+    assert len(ws._cells) == 400  # no cell was styled
+
+
+def test_conditional_arguments():
+    ws = openpyxl.Workbook().active
+    with pytest.raises(ValueError):
+        xlstyle(ws).conditional(col="A", op="~", value=1)
+    with pytest.raises(ValueError):
+        xlstyle(ws).conditional(col="A", op="between", value=1)
+    with pytest.raises(ValueError):
+        xlstyle(ws).conditional(col="A", op=">", value=1, data_bar="b")
@@ -0,0 +1,63 @@
+import openpyxl
+from nbkits.stylecache import style_cache_info
+from nbkits.xlstyler import xlstyle
+
+
+def _sheet():
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    for i in range(1, 21):
+        ws.append([i, i * 1.5, f"r{i}"])
+    return ws
+
+
+def test_tiled_copy():
+    ws = _sheet()
+    s = xlstyle(ws)
+    s.format(row=1, bold=True, number_format="0.00", ha="center")
+    s.patten_fill(row=2, type="solid", color="y").border(row=2, sides="outside")
+    tables = len(ws.parent._fonts), len(ws.parent._fills), len(ws.parent._borders)
+    misses = sum(info.misses for info in style_cache_info().values())
+
+    s.copy_style("A1:C2", "A3:C20")
+
+    for i in range(3, 21):
+        src = 1 if i % 2 else 2
+        for j in range(1, 4):
+            assert tuple(ws.cell(i, j)._style) == tuple(ws.cell(src, j)._style)
+    assert ws["B5"].number_format == "0.00" and ws["B5"].font.b
+    assert ws["C6"].fill.fill_type == "solid" and ws["C6"].border.right.style
+    assert tables == (
+        len(ws.parent._fonts),
+        len(ws.parent._fills),
+        len(ws.parent._borders),
+    )
+    assert misses == sum(info.misses for info in style_cache_info().values())
+
+    modified = s.cells_modified
+    s.copy_style("A1:C2", "A3:C20")
+    assert s.cells_modified == modified
+
+
+def test_copy_once_and_reset():
+    ws = _sheet()
+    s = xlstyle(ws).format(row=range(5, 9), italic=True)
+
+    s.copy_style("A1:B2", "A5:C8", tile=False)  # row 1-2 have no style
+
+    assert not ws["A5"].font.i and not ws["B6"].font.i
+    assert ws["C5"].font.i and ws["A7"].font.i
+
+    cells = len(ws._cells)
+    s.copy_style("E1:E2", "F1:F20")  # unstyled onto missing cells: nothing to do
+    assert len(ws._cells) == cells
+
+
+def test_copy_in_batch():
+    ws = _sheet()
+    with xlstyle(ws).batch() as s:
+        s.format(row=1, bold=True, number_format="0.0%")
+        s.copy_style("1:1", "3:4")
+
+    assert ws["C4"].font.b and ws["A3"].number_format == "0.0%"
+    assert not ws["A2"].font.b
@@ -0,0 +1,96 @@
+import io
+import zipfile
+
+import openpyxl
+from nbkits.xlstyler import xlstyle
+
+
+def test_whole_column_and_row_styles():
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    for i in range(1, 1001):
+        ws.cell(i, 1, i)
+    ws["C3"] = "x"
+
+    (
+        xlstyle(ws, dimension_styles=True)
+        .format(col="C", number_format="0.00", bold=True)
+        .patten_fill(row=2, type="solid", color="y")
+    )
+
+    assert len(ws._cells) == 1001  # no phantom cells in column C
+    assert ws.column_dimensions["C"].font.b
+    assert ws.column_dimensions["C"].number_format == "0.00"
+    assert ws["C3"].font.b and ws["C3"].number_format == "0.00"
+    assert ws.row_dimensions[2].fill.fill_type == "solid"
+    assert ws["A2"].fill.fill_type == "solid"
+    assert ws["A3"].fill.fill_type is None
+    assert not ws.column_dimensions["C"].customWidth  # Excel's default width
+
+    buf = io.BytesIO()
+    wb.save(buf)
+    sheet_xml = zipfile.ZipFile(buf).read("xl/worksheets/sheet1.xml").decode()
+    assert 'min="3"' in sheet_xml and "width=" not in sheet_xml
+    ws = openpyxl.load_workbook(buf).active
+    assert ws.column_dimensions["C"].font.b
+    assert ws.row_dimensions[2].fill.fill_type == "solid"
+
+
+def test_partial_selection_uses_cells():
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws["A3"] = 1
+    xlstyle(ws, dimension_styles=True).format(col="B", skip_header=1, italic=True)
+
+    assert not ws.column_dimensions["B"].has_style
+    assert ws["B2"].font.i and not ws["B1"].font.i
+
+
+def test_grouped_column_widths():
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws["A1"] = 1
+    ws.column_dimensions["A"].width = 20  # set up apart from the styler
+    s = xlstyle(ws, dimension_styles=True)
+    s.column_width(20, col=range(2, 200), group=True)
+    assert list(ws.column_dimensions) == ["A", "B"]
+    assert ws.column_dimensions["B"].range == "B:GQ"
+
+    s.column_width(5, col="D").format(col="E", bold=True)
+    dims = ws.column_dimensions
+    spans = [(d.min, d.max, d.width) for k, d in dims.items() if k != "A"]
+    assert dims["A"].width == 20 and dims["A"].min is None  # not merged
+    assert sorted(spans) == [
+        (2, 3, 20),
+        (4, 4, 5),
+        (5, 5, 20),
+        (6, 199, 20),
+    ]
+    assert ws.column_dimensions["E"].font.b
+
+    s.row_height(12)
+    assert ws.row_dimensions[1].height == 12
+    s.row_height(24, default=True)
+    assert not ws.row_dimensions[1].height
+    assert ws.sheet_format.defaultRowHeight == 24
+
+    buf = io.BytesIO()
+    wb.save(buf)
+    ws = openpyxl.load_workbook(buf).active
+    assert len(ws.column_dimensions) == 5
+    assert ws.column_dimensions["F"].width == 20
+    assert ws.sheet_format.defaultRowHeight == 24
+
+
+def test_column_widths_by_letter():
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    xlstyle(ws).column_width(20, col="B:D")
+    assert [ws.column_dimensions[c].width for c in "BCD"] == [20, 20, 20]
+
+    ws.column_dimensions["C"].width = 30
+    buf = io.BytesIO()
+    wb.save(buf)
+    ws = openpyxl.load_workbook(buf).active
+    spans = sorted((d.min, d.max, d.width) for d in ws.column_dimensions.values())
+    assert spans == [(2, 2, 20), (3, 3, 30), (4, 4, 20)]
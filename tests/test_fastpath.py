@@ -0,0 +1,63 @@
+from copy import copy
+
+import openpyxl
+import pytest
+from openpyxl.styles import Alignment, PatternFill
+from nbkits.xlstyler import xlstyle
+
+
+def _workbook():
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    for i in range(1, 21):
+        ws.append([i * j for j in range(1, 9)])
+    return wb
+
+
+def _merged(style, **changes):
+    style = copy(style)
+    for name, value in changes.items():
+        setattr(style, name, value)
+    return style
+
+
+def test_stamped_ids_save_same_xml_as_setters(xml_parts):
+    fast = _workbook()
+    (
+        xlstyle(fast.active)
+        .format(row=range(2, 21), number_format="0.00", bold=True, ha="right")
+        .format(row=1, color="FF0000", background_color="00FF00")
+        .patten_fill(row=range(5, 8), col=range(2, 5), type="darkGrid", color="0000FF")
+    )
+
+    slow = _workbook()
+    ws = slow.active
+    for row in ws.iter_rows(min_row=2, max_row=20):
+        for cell in row:
+            cell.alignment = Alignment(horizontal="right")
+            cell.number_format = "0.00"
+            cell.font = _merged(cell.font, bold=True)
+    for cell in ws[1]:
+        cell.font = _merged(cell.font, color="FF0000")
+        cell.fill = PatternFill(fill_type="solid", start_color="00FF00")
+    for row in ws.iter_rows(min_row=5, max_row=7, min_col=2, max_col=4):
+        for cell in row:
+            cell.fill = PatternFill(fill_type="darkGrid", start_color="0000FF")
+
+    assert xml_parts(fast) == xml_parts(slow)
+
+
+def test_cells_outside_the_sheet_raise():
+    ws = _workbook().active
+    s = xlstyle(ws)
+    calls = [
+        lambda: s.format(row=1048577, col=1, bold=True),
+        lambda: s.format(row=1, col=16385, bold=True),
+        lambda: s.border(row=1048577, col=1, sides="outside"),
+        lambda: s.define("big", bold=True).apply_style("big", row=1, col=16385),
+        lambda: s.copy_style("A1", "A1048577"),
+    ]
+    for call in calls:
+        with pytest.raises(ValueError, match="must be between 1 and"):
+            call()
+    assert (1048577, 1) not in ws._cells and (1, 16385) not in ws._cells
@@ -1,4 +1,6 @@
 import openpyxl
+import pytest
+from openpyxl.styles import GradientFill
 from nbkits.xlstyler import xlstyle
 from pathlib import Path
 
@@ -101,5 +103,67 @@ def main():
     wb.save(test_dir / "test_format.xlsx")
 
 
+def test_per_cell_styles():
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    for i in range(1, 101):
+        ws.append([i, -i, i * 10])
+
+    palette = ["r", "y", "g"]
+    heat = [[palette[(i + j) % 3] for j in range(3)] for i in range(100)]
+    (
+        xlstyle(ws)
+        .format(background_color=heat, bold=[[j == 0 for j in range(3)]] * 100)
+        .format(col="B", color=lambda v: "r" if v < 0 else None)
+        .patten_fill(row=1, type=[["solid", "darkGrid", None]], color="b")
+    )
+
+    assert ws["A2"].fill.fgColor.rgb == "00BFBF00"
+    assert ws["B3"].fill.fgColor.rgb == "00FF0000"
+    assert ws["A5"].font.b and not ws["C5"].font.b
+    assert ws["B7"].font.color.rgb == "00FF0000"
+    assert ws["C1"].fill.fill_type is None
+    assert ws["B1"].fill.fill_type == "darkGrid"
+    assert len(wb._fills) <= 8
+
+    with pytest.raises(ValueError):
+        xlstyle(ws).format(row=1, color=["r", "g"])
+
+
+def test_layered_format():
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    for i in range(1, 201):
+        ws.append([i, i * 2, i * 3])
+
+    s = xlstyle(ws)
+    s.format(size=14, color="r", ha="right", wrap_text=True)
+    s.format(col="A", family="Arial", background_color="y")
+    s.format(row=range(1, 201, 2), bold=True, va="top")
+    with s.batch():
+        s.format(row=1, italic=True).format(row=1, col="B", size=9)
+
+    a1, b1, c2 = ws["A1"], ws["B1"], ws["C2"]
+    assert (a1.font.name, a1.font.sz, a1.font.color.rgb) == ("Arial", 14, "00FF0000")
+    assert a1.font.b and a1.font.i and a1.fill.fill_type == "solid"
+    assert (b1.font.name, b1.font.sz, b1.font.b, b1.font.i) == ("Calibri", 9, True, True)
+    assert not c2.font.b and c2.font.sz == 14
+    assert a1.alignment.horizontal == "right" and a1.alignment.vertical == "top"
+    assert c2.alignment.wrap_text and c2.alignment.vertical is None
+    assert len(wb._fonts) <= 8 and len(wb._alignments) == 3
+
+
+def test_background_over_gradient_fill():
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.append([1, 2])
+    ws["A1"].fill = GradientFill(stop=("FF0000", "0000FF"))
+
+    xlstyle(ws).format(background_color="y", bold=True)
+
+    assert ws["A1"].fill.fill_type == "solid" and ws["A1"].font.b
+    assert ws["A1"]._style.fillId == ws["B1"]._style.fillId
+
+
 if __name__ == "__main__":
     main()
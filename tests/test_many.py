@@ -0,0 +1,61 @@
+import openpyxl
+import pytest
+from nbkits import xlstyle_many
+
+
+def _save_report(path, n_rows):
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.append(["name", "value"])
+    for i in range(n_rows):
+        ws.append([f"item {i}", i])
+    wb.save(path)
+
+
+def test_style_many_files(tmp_path):
+    paths = []
+    for k in range(4):
+        path = tmp_path / f"report{k}.xlsx"
+        _save_report(path, 10 + k)
+        paths.append(path)
+    broken = tmp_path / "broken.xlsx"
+    broken.write_text("not a workbook")
+    in_memory = openpyxl.Workbook()
+    in_memory.active.append([1, 2])
+
+    plan = [
+        ("format", dict(row=1, bold=True, background_color="tab:blue")),
+        ("border", dict(sides="outside")),
+        ("column_width", dict(width=[20, 10])),
+    ]
+    out = tmp_path / "out"
+    results = xlstyle_many(
+        [paths[0], broken, in_memory, *paths[1:]], plan, workers=2, output_dir=out
+    )
+
+    assert [r.error is None for r in results] == [True, False, True, True, True, True]
+    assert results[2].source is in_memory and in_memory.active["A1"].font.b
+    for k, path in enumerate(paths):
+        ws = openpyxl.load_workbook(out / path.name).active
+        assert ws["B1"].font.b and ws["B1"].fill.fgColor.rgb == "001F77B4"
+        assert ws[f"A{11 + k}"].border.bottom.style == "thin"
+        assert ws.column_dimensions["A"].width == 20
+        assert not openpyxl.load_workbook(path).active["A1"].font.b
+
+    with pytest.raises(ValueError):
+        xlstyle_many(paths, [("save", {})])
+
+
+def test_same_output_name_is_rejected(tmp_path):
+    paths = []
+    for name in ["a", "b"]:
+        (tmp_path / name).mkdir()
+        paths.append(tmp_path / name / "report.xlsx")
+        _save_report(paths[-1], 3)
+
+    with pytest.raises(ValueError, match="report.xlsx"):
+        xlstyle_many(paths, [], output_dir=tmp_path / "out")
+    assert not (tmp_path / "out" / "report.xlsx").exists()
+
+    results = xlstyle_many(paths, [("format", dict(row=1, bold=True))])
+    assert all(r.error is None for r in results)
@@ -0,0 +1,63 @@
+import io
+
+import openpyxl
+import pytest
+from nbkits import xlstyle
+
+
+def test_define_and_apply():
+    wb = openpyxl.Workbook()
+    ws1 = wb.active
+    ws2 = wb.create_sheet()
+    for ws in (ws1, ws2):
+        for i in range(1, 6):
+            ws.append([i, i * 2.5, f"x{i}"])
+
+    s1 = xlstyle(ws1).define(
+        "header", bold=True, background_color="tab:blue", sides="outside"
+    )
+    s1.define("amount", number_format="#,##0.00", ha="right")
+    s1.apply_style("header", row=1).apply_style("amount", col="B", skip_header=1)
+    xlstyle(ws2).apply_style("header", row=1).apply_style("Good", row=2)
+
+    header = wb._named_styles["header"].as_tuple()
+    assert all(tuple(c._style) == tuple(header) for c in ws1[1] + ws2[1])
+    assert ws1["C1"].style == "header" and ws2["A2"].style == "Good"
+    assert ws1["B3"].number_format == "#,##0.00"
+    assert ws1["B3"].alignment.horizontal == "right"
+    assert ws1["A2"].style == "Normal"
+
+    s1.apply_style("header", row=1)
+    assert s1.cells_modified == 3 + 4  # re-applying changes nothing
+
+    buf = io.BytesIO()
+    wb.save(buf)
+    ws = openpyxl.load_workbook(buf).active
+    cell = ws["B1"]
+    assert cell.style == "header" and cell.font.b
+    assert cell.fill.fill_type == "solid"
+    assert cell.border.left.style == "thin" and cell.border.bottom.style == "thin"
+    assert ws["B5"].style == "amount"
+
+
+def test_redefine_and_batch():
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.append([1, 2])
+    s = xlstyle(ws).define("note", italic=True)
+    s.define("note", bold=True)  # re-running a notebook cell updates the style
+    assert [n.name for n in wb._named_styles].count("note") == 1
+
+    with s.batch():
+        s.format(row=1, color="r")
+        s.apply_style("note", col="A")
+        s.format(col="A", underline=True)
+
+    assert ws["A1"].font.b and not ws["A1"].font.i and ws["A1"].font.u
+    assert ws["A1"].font.color.type == "theme"  # the red was replaced
+    assert ws["B1"].font.color.rgb.endswith("FF0000")
+
+    with pytest.raises(ValueError):
+        s.apply_style("missing")
+    with pytest.raises(ValueError):
+        s.define("varying", bold=lambda v: v > 1)
@@ -0,0 +1,84 @@
+import openpyxl
+from nbkits import xlprofile, xlstyle
+from nbkits.stylecache import clear_style_cache
+
+
+def _sheet():
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    for i in range(10):
+        ws.append(list(range(4)))
+    return ws
+
+
+def test_styler_stats():
+    clear_style_cache()
+    ws = _sheet()
+    seen = []
+    s = xlstyle(ws, on_op=seen.append)
+    s.format(row=range(1, 13), bold=True, color="tab:red").border(sides="outside")
+
+    fmt, border = s.stats()
+    assert seen == [fmt, border]
+    assert (fmt.op, fmt.sheet) == ("format", ws.title)
+    assert fmt.cells_touched == 48 and fmt.cells_created == 8
+    assert fmt.color_resolutions == 1
+    assert border.cells_touched == 48 and border.cells_created == 0
+    assert border.styles_allocated <= 10  # the side and up to 9 borders
+
+
+def test_profile_aggregates_across_stylers():
+    ws1, ws2 = _sheet(), _sheet()
+    with xlprofile() as prof:
+        xlstyle(ws1).format(bold=True).column_width(10)
+        with xlstyle(ws2).batch() as s:
+            s.format(row=1, italic=True).patten_fill(row=2, type="solid", color="r")
+
+    summary = prof.summary()
+    assert summary["format"]["calls"] == 2
+    assert summary["column_width"]["cells_touched"] == 4
+    assert summary["apply_batch"]["cells_touched"] == 8
+    assert "format" in prof.report()
+    assert xlstyle(ws1).stats() == []
+
+
+def test_rerun_modifies_nothing():
+    ws = _sheet()
+
+    def style(s):
+        s.format(row=1, bold=True, background_color="y").border(col="A:C", sides="all")
+        s.patten_fill(row=range(2, 11, 2), type="solid", color="c")
+        with s.batch():
+            s.format(col="D", italic=True).border(col="D", sides="outside", ls="thick")
+        return s
+
+    first = style(xlstyle(ws, profile=True))
+    modified = [op.cells_modified for op in first.stats()]
+    assert modified == [4, 30, 20, 0, 0, 10]
+    assert first.cells_modified == sum(modified)
+
+    again = style(xlstyle(ws, profile=True))
+    assert again.cells_modified == 0
+    assert all(op.cells_modified == 0 for op in again.stats())
+
+
+def test_format_counts_allocated_styles():
+    clear_style_cache()
+    s = xlstyle(_sheet(), profile=True)
+    s.format(bold=True, size=15, ha="center", background_color="y")
+    s.format(bold=True, size=15, ha="center", background_color="y")
+
+    first, again = s.stats()
+    assert first.styles_allocated == 3  # a font, a fill and an alignment
+    assert again.styles_allocated == 0
+
+
+def test_default_styles_modify_nothing():
+    ws = _sheet()
+    ws.cell(20, 1)  # an empty, unstyled cell
+    s = xlstyle(ws, profile=True)
+    used = s.used_range()
+    s.format(row=range(1, 11), bold=False).apply_style("Normal", row=20, col=1)
+
+    assert [rec.cells_modified for rec in s.stats()] == [0, 0]
+    assert s._used_ranges[False][1] is used  # the cached range is still valid
@@ -0,0 +1,61 @@
+import pytest
+from openpyxl import Workbook
+from openpyxl.styles import Font
+from nbkits import xlstyle
+from nbkits.xlstyler import _IndexSet, _parse_arg_cols, _parse_arg_rows
+
+
+def test_rows_with_skips():
+    rows = _parse_arg_rows(
+        max_row=20, skip_rows=[5, range(8, 11), 5], skip_header=2, skip_footer=3
+    )
+    expected = [r for r in range(3, 18) if r not in (5, 8, 9, 10)]
+    assert list(rows) == expected
+    assert len(rows) == len(expected)
+    assert (rows.first, rows.last) == (3, 17)
+    assert 4 in rows and 9 not in rows and 18 not in rows
+
+
+def test_rows_are_not_materialized():
+    rows = _parse_arg_rows(max_row=1_000_000, skip_rows=list(range(2, 500_000, 2)))
+    assert len(rows) == 1_000_000 - 249_999
+    assert len(rows.intervals) == 250_000
+    assert _parse_arg_rows(max_row=1_000_000, skip_header=1).intervals == [
+        (2, 1_000_000)
+    ]
+
+
+def test_cols():
+    assert list(_parse_arg_cols(["B:D", "F", "C"])) == [2, 3, 4, 6]
+    assert list(_parse_arg_cols("AA")) == [27]
+    assert list(_parse_arg_cols([range(5, 1, -1), 9])) == [2, 3, 4, 5, 9]
+    assert list(_parse_arg_cols(max_column=3)) == [1, 2, 3]
+    with pytest.raises(ValueError):
+        _parse_arg_cols(["A", "1x"])
+
+
+def test_difference():
+    a = _IndexSet([(1, 10), (20, 30)])
+    b = _IndexSet([(0, 2), (5, 5), (9, 21), (30, 40)])
+    assert list(a.difference(b)) == [3, 4, 6, 7, 8] + list(range(22, 30))
+
+
+def test_used_range():
+    ws = Workbook().active
+    for i in range(1, 6):
+        ws.append([i, i * 2])
+    ws.cell(50, 10)  # an empty cell created by reading it
+    ws.cell(7, 4).font = Font(bold=True)
+
+    s = xlstyle(ws)
+    assert (ws.max_row, ws.max_column) == (50, 10)
+    assert s.used_range() == (7, 4)
+    assert s.used_range(ignore_style_only=True) == (5, 2)
+
+    s.format(row=9, col=1, italic=True)  # a write refreshes the cached range
+    assert s.used_range() == (9, 4)
+
+    values = xlstyle(ws, ignore_style_only=True)
+    values.border(sides="outside")
+    assert ws.cell(5, 2).border.bottom.style == "thin"
+    assert ws.cell(9, 1).border.bottom.style is None
@@ -0,0 +1,49 @@
+import io
+
+import openpyxl
+import pytest
+from nbkits.xlstream import xlstream
+
+
+def test_stream_bands_and_borders():
+    wb = openpyxl.Workbook(write_only=True)
+    ws = wb.create_sheet()
+    s = (
+        xlstream(ws, header=1, footer=1)
+        .column_width([10, 12, 14])
+        .format(band="header", bold=True, background_color="tab:blue")
+        .format(col="C", band="body", number_format="0.00")
+        .border(band="body", sides="outside", ls="medium")
+        .border(band="body", sides="h", c="r")
+        .patten_fill(col=1, band="footer", type="solid", color="y")
+    )
+    data = [["a", "b", "c"]] + [[i, i * 2, i / 3] for i in range(5)] + [["sum", 20, None]]
+    for cells in s.rows(iter(data)):
+        ws.append(cells)
+
+    buf = io.BytesIO()
+    wb.save(buf)
+    ws = openpyxl.load_workbook(buf).active
+
+    assert ws["A1"].font.b and ws["C1"].fill.fgColor.rgb == "001F77B4"
+    assert ws["C3"].number_format == "0.00" and ws["B3"].number_format == "General"
+    assert ws["A2"].border.top.style == "medium"
+    assert ws["A2"].border.left.style == "medium"
+    assert getattr(ws["B2"].border.left, "style", None) is None
+    assert ws["B4"].border.top.style == "thin"
+    assert ws["B4"].border.top.color.rgb == "00FF0000"
+    assert ws["C6"].border.bottom.style == "medium"
+    assert ws["C6"].border.right.style == "medium"
+    assert ws["A7"].fill.fill_type == "solid"
+    assert getattr(ws["A7"].border.top, "style", None) is None
+    assert ws["C7"].value is None
+    assert ws.column_dimensions["C"].width == 14
+
+
+def test_stream_rejects_per_cell_arguments():
+    ws = openpyxl.Workbook(write_only=True).create_sheet()
+    s = xlstream(ws, header=1)
+    with pytest.raises(ValueError, match="bold"):
+        s.format(bold=[True, False])
+    with pytest.raises(ValueError, match="color"):
+        s.patten_fill(type="solid", color=lambda v: "r")
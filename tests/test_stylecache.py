@@ -0,0 +1,28 @@
+import openpyxl
+from nbkits.stylecache import intern_border, intern_side, style_cache_info
+from nbkits.xlstyler import xlstyle
+
+
+def test_identical_styles_share_one_instance():
+    # separate workbooks: only the intern tables can make their styles shared
+    ws1, ws2 = openpyxl.Workbook().active, openpyxl.Workbook().active
+    xlstyle(ws1).format(row=range(1, 3), col=range(1, 3), bold=True, ha="center")
+    hits = style_cache_info()["font"].hits
+    xlstyle(ws2).format(row=5, col=5, bold=True, ha="center")
+
+    def style_objects(cell):
+        wb, style = cell.parent.parent, cell._style
+        return wb._fonts[style.fontId], wb._alignments[style.alignmentId]
+
+    font, alignment = style_objects(ws1["A1"])
+    assert style_objects(ws1["B2"]) == (font, alignment)
+    font2, alignment2 = style_objects(ws2["E5"])
+    assert font2 is font and alignment2 is alignment
+    assert style_cache_info()["font"].hits > hits
+
+
+def test_border_interning():
+    side = intern_side(style="thin", color="FF0000")
+    assert intern_side(style="thin", color="FF0000") is side
+    assert intern_border(top=side, left=side) is intern_border(top=side, left=side)
+    assert style_cache_info()["side"].hits >= 1
@@ -0,0 +1,67 @@
+import pickle
+
+import openpyxl
+from nbkits import xlstyle, xltemplate
+from nbkits.xltemplate import StyleTemplate
+
+
+def _workbook(n_rows):
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    for i in range(n_rows):
+        ws.append([i, -i, i * 10])
+    return wb
+
+
+def _chain(s):
+    return (
+        s.column_width([12, 8, 10])
+        .format(row=1, bold=True, background_color="tab:blue", color="w")
+        .format(col="B:C", skip_header=1, number_format="0.00")
+        .patten_fill(row=range(2, 40, 2), skip_footer=1, type="solid", color="y")
+        .border(sides="outside", ls="medium")
+        .border(skip_header=1, sides="h", c="tab:gray")
+        .conditional(col="B", skip_header=1, op="<", value=-5, color="r")
+    )
+
+
+def test_template_replays_chain(xml_parts):
+    template = _chain(xltemplate())
+    restored = [
+        pickle.loads(pickle.dumps(template)),
+        StyleTemplate.from_json(template.to_json()),
+    ]
+
+    for n_rows in [5, 30]:
+        wb = _workbook(n_rows)
+        _chain(xlstyle(wb.active))
+        expected = xml_parts(wb)
+        for t in [template, *restored]:
+            wb = _workbook(n_rows)
+            t.apply(wb.active)
+            assert xml_parts(wb) == expected
+
+
+def test_template_groups(xml_parts):
+    def chain(s):
+        return s.border(
+            skip_header=1, groups="A", sides="outside", h="hair"
+        ).patten_fill(skip_header=1, groups="A", type="solid", color="y")
+
+    def workbook(keys):
+        wb = openpyxl.Workbook()
+        wb.active.append(["key", "value"])
+        for i, key in enumerate(keys):
+            wb.active.append([key, i])
+        return wb
+
+    template = chain(xltemplate())
+    restored = StyleTemplate.from_json(template.to_json())
+    for keys in ["aaabcc", "abbbbc"]:
+        wb = workbook(keys)
+        chain(xlstyle(wb.active))
+        expected = xml_parts(wb)
+        for t in [template, restored]:
+            wb = workbook(keys)
+            t.apply(wb.active)
+            assert xml_parts(wb) == expected
@@ -0,0 +1,91 @@
+import io
+
+import openpyxl
+import pytest
+from nbkits import xlstyle
+
+xlsxwriter = pytest.importorskip("xlsxwriter")
+
+
+def _chain(s):
+    return (
+        s.column_width([12, 8, 8, 8])
+        .row_height(30, row=1)
+        .format(row=1, bold=True, background_color="tab:blue", color="w", ha="center")
+        .format(col="B:C", skip_header=1, number_format="0.00", italic=True)
+        .patten_fill(row=range(2, 13, 2), type="darkGrid", color="xkcd:light grey")
+        .border(sides="outside", ls="medium")
+        .border(skip_header=1, skip_footer=1, sides="h", c="r")
+        .border(row=5, col="D", u=True, d=True, c="g")
+    )
+
+
+def _summary(ws):
+    def rgb(color):
+        return color.rgb[-6:] if color is not None and color.type == "rgb" else None
+
+    def side(s):
+        return (s.style, rgb(s.color)) if s is not None and s.style else None
+
+    return {
+        c.coordinate: (
+            c.value,
+            c.font.b,
+            c.font.i,
+            rgb(c.font.color),
+            c.fill.fill_type,
+            rgb(c.fill.fgColor) if c.fill.fill_type else None,
+            c.number_format,
+            c.alignment.horizontal,
+            *(side(s) for s in [c.border.top, c.border.bottom, c.border.left]),
+            side(c.border.right),
+            side(c.border.diagonal),
+            bool(c.border.diagonalUp),
+            bool(c.border.diagonalDown),
+        )
+        for row in ws.iter_rows(min_row=1, max_row=12, max_col=4)
+        for c in row
+    }
+
+
+def test_xlsxwriter_backend_matches_openpyxl():
+    data = [["a", "b", "c", "d"]] + [[i, i + 0.5, -i, None] for i in range(11)]
+
+    wb = openpyxl.Workbook()
+    for values in data:
+        wb.active.append(values)
+    _chain(xlstyle(wb.active))
+    expected = _summary(wb.active)
+
+    buf = io.BytesIO()
+    xwb = xlsxwriter.Workbook(buf, {"constant_memory": True, "in_memory": True})
+    _chain(xlstyle(xwb.add_worksheet())).write_rows(data)
+    xwb.close()
+
+    ws = openpyxl.load_workbook(buf).active
+    assert _summary(ws) == expected
+    assert ws.row_dimensions[1].height == 30
+
+    with pytest.raises(ValueError):
+        xlstyle(xwb.add_worksheet()).format(color=lambda v: "r")
+    with pytest.raises(ValueError, match="profile"):
+        xlstyle(xwb.add_worksheet(), profile=True)
+    with pytest.raises(ValueError, match="groups"):
+        xlstyle(xwb.add_worksheet()).border(groups="A", sides="outside")
+
+
+def test_xlsxwriter_alignment():
+    buf = io.BytesIO()
+    xwb = xlsxwriter.Workbook(buf, {"in_memory": True})
+    s = xlstyle(xwb.add_worksheet())
+    s.format(col="A", ha="general", wrap_text=True)
+    s.format(col="B", ha="right", indent=2)
+    s.write_rows([["a", "b"]])
+    xwb.close()
+
+    ws = openpyxl.load_workbook(buf).active
+    assert ws["A1"].alignment.horizontal is None and ws["A1"].alignment.wrap_text
+    assert (ws["B1"].alignment.horizontal, ws["B1"].alignment.indent) == ("right", 2)
+
+    with pytest.raises(ValueError):
+        s.format(ha="centerContinuous", indent=1)